@@ -2,7 +2,9 @@
 #       Imports
 #-----------------------------------------------------------#
 
-from .const import DOMAIN, PLATFORMS
+from .const import DATA_MANAGER, DATA_RUNTIME, DOMAIN, PLATFORMS
+from .utils.runtime import DynamicSceneRuntime
+from .utils.scene_manager import DynamicSceneManager, async_remove_storage
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import IntegrationError
@@ -32,16 +34,21 @@ async def async_setup(hass: HomeAssistant, config: Dict[Any, str]) -> bool:
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     data = hass.data.setdefault(DOMAIN, {})
 
-    data[config_entry.entry_id] = { UNDO_LISTENERS: [] }
+    runtime = DynamicSceneRuntime(hass, config_entry)
+    manager = DynamicSceneManager(hass, config_entry, runtime)
+
+    data[config_entry.entry_id] = { DATA_MANAGER: manager, DATA_RUNTIME: runtime, UNDO_LISTENERS: [] }
     data[config_entry.entry_id][UNDO_LISTENERS].append(config_entry.add_update_listener(async_update_options))
 
+    await manager.async_setup()
+
     for platform in PLATFORMS:
         hass.async_create_task(hass.config_entries.async_forward_entry_setup(config_entry, platform))
 
     return True
 
 async def async_update_options(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    hass.data[DOMAIN][config_entry.entry_id][DATA_MANAGER].update_options()
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     unload_ok = all(
@@ -57,10 +64,14 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         data[config_entry.entry_id][UNDO_LISTENERS].pop()()
 
     if unload_ok:
-        data.pop(config_entry.entry_id)
+        entry_data = data.pop(config_entry.entry_id)
+        entry_data[DATA_MANAGER].shutdown()
+        entry_data[DATA_RUNTIME].shutdown()
 
     return unload_ok
 
 async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    await async_remove_storage(hass, config_entry)
+
     if len(hass.data[DOMAIN]) == 0:
         hass.data.pop(DOMAIN)
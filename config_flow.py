@@ -5,12 +5,21 @@
 from __future__ import annotations
 from .const import (
     CONF_BLOCK_ENTITIES,
+    CONF_CONFIGURE_RATE_LIMITS,
+    CONF_CONTINUOUS_TRANSITION,
+    CONF_DEADBAND_BRIGHTNESS_PCT,
+    CONF_DEADBAND_DELTA_E,
     CONF_DURATION,
     CONF_ENABLED,
+    CONF_MANUAL_CONTROL_HOLD,
+    CONF_MODE,
+    CONF_RATE_LIMITS,
     CONF_ROTATE_COLORS,
     CONF_SCENE_ACTIVE,
     CONF_SCENE_SELECTED,
     CONF_SCENES_ENABLED,
+    CONF_SEED,
+    CONF_START_SPREAD,
     CONF_TRANSITION,
     CONF_VARIANCE_BRIGHTNESS_PCT,
     CONF_VARIANCE_COLOR_TEMP,
@@ -18,14 +27,24 @@ from .const import (
     CONF_VARIANCE_HUE,
     CONF_VARIANCE_SATURATION,
     CONF_VARIANCE_TRANSITION,
+    DEFAULT_CONTINUOUS_TRANSITION,
+    DEFAULT_DEADBAND_BRIGHTNESS_PCT,
+    DEFAULT_DEADBAND_DELTA_E,
+    DEFAULT_MANUAL_CONTROL_HOLD,
+    DEFAULT_MODE,
+    DEFAULT_SEED,
+    DEFAULT_START_SPREAD,
     DOMAIN,
+    MODES,
     SCENE_DOMAIN
 )
+from .utils import is_scene_id
+from .utils.rate_limiter import RATE_LIMIT_DEFAULT, RATE_LIMIT_DEFAULT_RATE
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, entity_registry
 from typing import Any, Dict, Union
 import voluptuous as vol
 
@@ -39,9 +58,13 @@ ABORT_REASON_ALREADY_CONFIGURED = "already_configured"
 
 # ------ Steps ---------------
 STEP_INIT = "init"
+STEP_RATE_LIMITS = "rate_limits"
 STEP_SCENE = "scene"
 STEP_USER = "user"
 
+# ------ Block Entities ---------------
+BLOCK_ENTITY_DOMAINS = ["binary_sensor", "input_boolean", "light", "media_player", "person", "remote", "switch"]
+
 
 #-----------------------------------------------------------#
 #       Steps
@@ -54,34 +77,56 @@ class MD_Steps:
 
     @staticmethod
     def options_init(hass: HomeAssistant, data: Dict[str, Any] = {}) -> vol.Schema:
-        scenes_enabled = list(data.keys())
+        scenes_enabled = [key for key in data.keys() if is_scene_id(key)]
         scenes = [None] + hass.states.async_entity_ids(SCENE_DOMAIN)
 
         return vol.Schema({
             vol.Required(CONF_SCENES_ENABLED, default=scenes_enabled): cv.multi_select(scenes_enabled),
+            vol.Required(CONF_CONFIGURE_RATE_LIMITS, default=False): bool,
             vol.Optional(CONF_SCENE_SELECTED, default=scenes[0]): vol.In(scenes)
         })
 
+    @staticmethod
+    def options_rate_limits(hass: HomeAssistant, data: Dict[str, Any] = {}) -> vol.Schema:
+        rate_limits = data.get(CONF_RATE_LIMITS, {})
+        registry = entity_registry.async_get(hass)
+        platforms = sorted(set(entry.platform for entry in registry.entities.values() if entry.domain == LIGHT_DOMAIN))
+        default_rate = rate_limits.get(RATE_LIMIT_DEFAULT, RATE_LIMIT_DEFAULT_RATE)
+        schema = { vol.Required(RATE_LIMIT_DEFAULT, default=default_rate): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=1000)) }
+
+        for platform in platforms:
+            schema[vol.Optional(platform, description={ "suggested_value": rate_limits.get(platform) })] = vol.All(vol.Coerce(float), vol.Range(min=0.1, max=1000))
+
+        return vol.Schema(schema)
+
     @staticmethod
     def options_scene(hass: HomeAssistant, scene_id: str, data: Dict[str, Any] = {}) -> vol.Schema:
         scene_data = data.get(scene_id, {})
-        scenes_enabled = list(data.keys())
+        scenes_enabled = [key for key in data.keys() if is_scene_id(key)]
         scenes = [None] + hass.states.async_entity_ids(SCENE_DOMAIN)
-        lights = hass.states.async_entity_ids(LIGHT_DOMAIN)
+        block_entities = scene_data.get(CONF_BLOCK_ENTITIES, [])
+        block_entity_options = sorted(set(hass.states.async_entity_ids(BLOCK_ENTITY_DOMAINS)) | set(block_entities))
 
         return vol.Schema({
             vol.Required(CONF_SCENE_ACTIVE, default=scene_id): scene_id,
             vol.Required(CONF_ENABLED, default=(scene_id in scenes_enabled)): bool,
+            vol.Required(CONF_MODE, default=scene_data.get(CONF_MODE, DEFAULT_MODE)): vol.In(MODES),
+            vol.Required(CONF_SEED, default=scene_data.get(CONF_SEED, DEFAULT_SEED)): vol.All(int, vol.Range(min=0)),
             vol.Required(CONF_TRANSITION, default=scene_data.get(CONF_TRANSITION, 2)): vol.All(int, vol.Range(min=0, max_included=False)),
             vol.Required(CONF_VARIANCE_TRANSITION, default=scene_data.get(CONF_VARIANCE_TRANSITION, 0)): vol.All(int, vol.Range(min=0, max=100)),
             vol.Required(CONF_DURATION, default=scene_data.get(CONF_DURATION, 5)): vol.All(int, vol.Range(min=0, max_included=False)),
             vol.Required(CONF_VARIANCE_DURATION, default=scene_data.get(CONF_VARIANCE_DURATION, 0)): vol.All(int, vol.Range(min=0, max=100)),
+            vol.Required(CONF_CONTINUOUS_TRANSITION, default=scene_data.get(CONF_CONTINUOUS_TRANSITION, DEFAULT_CONTINUOUS_TRANSITION)): vol.All(int, vol.Range(min=2, max=6553)),
+            vol.Required(CONF_START_SPREAD, default=scene_data.get(CONF_START_SPREAD, DEFAULT_START_SPREAD)): vol.All(int, vol.Range(min=0, max=3600)),
             vol.Required(CONF_ROTATE_COLORS, default=scene_data.get(CONF_ROTATE_COLORS, False)): bool,
             vol.Required(CONF_VARIANCE_COLOR_TEMP, default=scene_data.get(CONF_VARIANCE_COLOR_TEMP, 40)): vol.All(int, vol.Range(min=0, max=300)),
             vol.Required(CONF_VARIANCE_HUE, default=scene_data.get(CONF_VARIANCE_HUE, 15)): vol.All(int, vol.Range(min=0, max=360)),
             vol.Required(CONF_VARIANCE_SATURATION, default=scene_data.get(CONF_VARIANCE_SATURATION, 5)): vol.All(int, vol.Range(min=0, max=100)),
             vol.Required(CONF_VARIANCE_BRIGHTNESS_PCT, default=scene_data.get(CONF_VARIANCE_BRIGHTNESS_PCT, 5)): vol.All(int, vol.Range(min=0, max=100)),
-            vol.Required(CONF_BLOCK_ENTITIES, default=scene_data.get(CONF_BLOCK_ENTITIES, [])): cv.multi_select(lights),
+            vol.Required(CONF_DEADBAND_DELTA_E, default=scene_data.get(CONF_DEADBAND_DELTA_E, DEFAULT_DEADBAND_DELTA_E)): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+            vol.Required(CONF_DEADBAND_BRIGHTNESS_PCT, default=scene_data.get(CONF_DEADBAND_BRIGHTNESS_PCT, DEFAULT_DEADBAND_BRIGHTNESS_PCT)): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+            vol.Required(CONF_MANUAL_CONTROL_HOLD, default=scene_data.get(CONF_MANUAL_CONTROL_HOLD, DEFAULT_MANUAL_CONTROL_HOLD)): vol.All(int, vol.Range(min=0, max=86400)),
+            vol.Required(CONF_BLOCK_ENTITIES, default=block_entities): cv.multi_select(block_entity_options),
             vol.Optional(CONF_SCENE_SELECTED, default=scenes[0]): vol.In(scenes)
         })
 
@@ -146,9 +191,12 @@ class Matjak_OptionsFlow(OptionsFlow):
 
     async def async_step_init(self, user_input: Union[Dict[str, Any], None] = None) -> Dict[str, Any]:
         if user_input is not None:
-            self._data = { scene_id: scene_config for scene_id, scene_config in self._data.items() if scene_id in user_input[CONF_SCENES_ENABLED] }
+            self._data = { key: value for key, value in self._data.items() if not is_scene_id(key) or key in user_input[CONF_SCENES_ENABLED] }
             self._scene_selected = user_input.get(CONF_SCENE_SELECTED)
 
+            if user_input.get(CONF_CONFIGURE_RATE_LIMITS):
+                return await self.async_step_rate_limits()
+
             if self._scene_selected is None:
                 return self.async_create_entry(title=DOMAIN, data=self._data)
 
@@ -157,6 +205,18 @@ class Matjak_OptionsFlow(OptionsFlow):
         schema = MD_Steps.options_init(self.hass, self._data)
         return self.async_show_form(step_id=STEP_INIT, data_schema=schema)
 
+    async def async_step_rate_limits(self, user_input: Union[Dict[str, Any], None] = None) -> Dict[str, Any]:
+        if user_input is not None:
+            self._data[CONF_RATE_LIMITS] = user_input
+
+            if self._scene_selected is None:
+                return self.async_create_entry(title=DOMAIN, data=self._data)
+
+            return await self.async_step_scene()
+
+        schema = MD_Steps.options_rate_limits(self.hass, self._data)
+        return self.async_show_form(step_id=STEP_RATE_LIMITS, data_schema=schema)
+
     async def async_step_scene(self, user_input: Union[Dict[str, Any], None] = None) -> Dict[str, Any]:
         if user_input is not None:
             scene_id = user_input.pop(CONF_SCENE_ACTIVE)
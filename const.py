@@ -9,7 +9,8 @@ from homeassistant.components.light import (
     ATTR_COLOR_TEMP,
     ATTR_HS_COLOR,
     ATTR_TRANSITION,
-    DOMAIN as LIGHT_DOMAIN
+    DOMAIN as LIGHT_DOMAIN,
+    SUPPORT_TRANSITION
 )
 from homeassistant.components.scene import DOMAIN as SCENE_DOMAIN
 from homeassistant.const import (
@@ -17,6 +18,7 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
+    ATTR_SUPPORTED_FEATURES,
     CONF_ENTITY_ID,
     CONF_ID,
     CONF_LIGHTS,
@@ -35,18 +37,25 @@ import homeassistant.helpers.config_validation as cv
 
 DOMAIN = "dynamic_scene"
 DOMAIN_FRIENDLY_NAME = "Dynamic Scene"
-PLATFORMS = ["sensor"]
+PLATFORMS = ["sensor", "switch"]
+
+
+#-----------------------------------------------------------#
+#       Data Keys
+#-----------------------------------------------------------#
+
+DATA_MANAGER = "manager"
+DATA_RUNTIME = "runtime"
 
 
 #-----------------------------------------------------------#
 #       Attributes
 #-----------------------------------------------------------#
 
-ATTR_ACTIVE_SCENES = "active_scenes"
 ATTR_BLOCK_ENTITIES = "block_entities"
 ATTR_COLOR_VALUE = "color_value"
 ATTR_DURATION = "duration"
-ATTR_PAUSED_SCENES = "paused_scenes"
+ATTR_SCENE_ID = "scene_id"
 
 
 #-----------------------------------------------------------#
@@ -61,10 +70,19 @@ CONF_ROTATE_COLORS = "rotate_colors"
 
 #--- Config Flow -----
 CONF_BLOCK_ENTITIES = "block_entities"
+CONF_CONFIGURE_RATE_LIMITS = "configure_rate_limits"
+CONF_CONTINUOUS_TRANSITION = "continuous_transition"
+CONF_DEADBAND_BRIGHTNESS_PCT = "deadband_brightness_pct"
+CONF_DEADBAND_DELTA_E = "deadband_delta_e"
 CONF_DURATION = "duration"
 CONF_ENABLED = "enabled"
+CONF_MANUAL_CONTROL_HOLD = "manual_control_hold"
+CONF_MODE = "mode"
+CONF_RATE_LIMITS = "rate_limits"
 CONF_ROTATE_COLORS = "rotate_colors"
 CONF_SCENE_ACTIVE = "scene_active"
+CONF_SEED = "seed"
+CONF_START_SPREAD = "start_spread"
 CONF_TRANSITION = "transition"
 CONF_VARIANCE_BRIGHTNESS_PCT = "brightness_pct_variance"
 CONF_VARIANCE_COLOR_TEMP = "color_temp_variance"
@@ -74,6 +92,31 @@ CONF_VARIANCE_SATURATION = "saturation_variance"
 CONF_VARIANCE_TRANSITION = "transition_variance"
 
 
+#-----------------------------------------------------------#
+#       Modes
+#-----------------------------------------------------------#
+
+MODE_CONTINUOUS = "continuous"
+MODE_RANDOM = "random"
+MODE_SYNCHRONIZED = "synchronized"
+MODE_TIME_SLOTS = "time_slots"
+
+MODES = [MODE_RANDOM, MODE_TIME_SLOTS, MODE_CONTINUOUS, MODE_SYNCHRONIZED]
+
+
+#-----------------------------------------------------------#
+#       Defaults
+#-----------------------------------------------------------#
+
+DEFAULT_CONTINUOUS_TRANSITION = 60
+DEFAULT_DEADBAND_BRIGHTNESS_PCT = 2
+DEFAULT_DEADBAND_DELTA_E = 2
+DEFAULT_MANUAL_CONTROL_HOLD = 300
+DEFAULT_MODE = MODE_RANDOM
+DEFAULT_SEED = 0
+DEFAULT_START_SPREAD = 0
+
+
 #-----------------------------------------------------------#
 #       Services
 #-----------------------------------------------------------#
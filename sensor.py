@@ -3,31 +3,23 @@
 #-----------------------------------------------------------#
 
 from .const import (
-    ATTR_ACTIVE_SCENES,
-    ATTR_DOMAIN,
-    ATTR_ENTITY_ID,
-    ATTR_PAUSED_SCENES,
-    ATTR_SERVICE,
-    ATTR_SERVICE_DATA,
-    ATTR_TRANSITION,
     CONF_ID,
     CONF_LIGHTS,
+    DATA_MANAGER,
+    DATA_RUNTIME,
+    DOMAIN,
     DOMAIN_FRIENDLY_NAME,
-    EVENT_CALL_SERVICE,
-    EVENT_HOMEASSISTANT_START,
-    SCENE_DOMAIN,
-    SERVICES,
-    SERVICE_TURN_ON
+    SERVICES
 )
-from .utils.dynamic_scene import DynamicScene
+from .utils.command_queue import CommandQueue
+from .utils.scene_manager import DynamicSceneManager
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import EntityPlatform
-from homeassistant.helpers.event import async_call_later
 from logging import getLogger
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Union
 
 
 #-----------------------------------------------------------#
@@ -35,7 +27,6 @@ from typing import Any, Callable, Dict, List
 #-----------------------------------------------------------#
 
 LOGGER = getLogger(__name__)
-MIN_DELAY_TIME = 2
 
 
 #-----------------------------------------------------------#
@@ -44,7 +35,8 @@ MIN_DELAY_TIME = 2
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: Callable) -> bool:
     """ Sets up the sensor entry. """
-    async_add_entities([ML_SensorEntity(config_entry)], update_before_add=True)
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities([ML_SensorEntity(data[DATA_MANAGER], data[DATA_RUNTIME].command_queue)])
     register_services(entity_platform.current_platform.get())
 
 
@@ -63,15 +55,17 @@ def register_services(platform: EntityPlatform) -> None:
 #-----------------------------------------------------------#
 
 class ML_SensorEntity(SensorEntity):
+    """ Summary entity holding the number of running dynamic scenes. """
     #--------------------------------------------#
     #       Constructor
     #--------------------------------------------#
 
-    def __init__(self, config_entry: ConfigEntry):
-        self._config_entry : ConfigEntry             = config_entry
-        self._listeners    : List[str]               = []
-        self._name         : str                     = f"{DOMAIN_FRIENDLY_NAME}"
-        self._scenes       : Dict[str, DynamicScene] = {}
+    def __init__(self, manager: DynamicSceneManager, command_queue: CommandQueue):
+        self._command_queue : CommandQueue         = command_queue
+        self._listeners     : List[Callable]       = []
+        self._manager       : DynamicSceneManager  = manager
+        self._name          : str                  = f"{DOMAIN_FRIENDLY_NAME}"
+        self._written_state : Union[int, None]     = None
 
 
     #-----------------------------------------------------------------------------#
@@ -83,14 +77,9 @@ class ML_SensorEntity(SensorEntity):
     #--------------------------------------------#
 
     @property
-    def device_state_attributes(self) -> Dict[str, Any]:
-        """ Gets a dict containing the entity attributes. """
-        attributes = {
-            ATTR_ACTIVE_SCENES: [scene_id for scene_id, scene in self._scenes.items() if scene.is_running],
-            ATTR_PAUSED_SCENES: [scene_id for scene_id, scene in self._scenes.items() if not scene.is_running]
-        }
-
-        return attributes
+    def extra_state_attributes(self) -> Dict[str, int]:
+        """ Gets the number of light commands sent, coalesced and dropped (as of the last state write). """
+        return self._command_queue.statistics
 
     @property
     def icon(self) -> str:
@@ -110,12 +99,12 @@ class ML_SensorEntity(SensorEntity):
     @property
     def should_poll(self) -> bool:
         """ Gets a boolean indicating whether Home Assistant should automatically poll the entity. """
-        return True
+        return False
 
     @property
-    def state(self) -> bool:
+    def state(self) -> int:
         """ Gets the entity state. """
-        return len([scene_id for scene_id in self._scenes.keys()])
+        return len(self._manager.active_scenes)
 
     @property
     def unique_id(self) -> str:
@@ -129,22 +118,13 @@ class ML_SensorEntity(SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """ Triggered when the entity has been added to Home Assistant. """
-        async def async_initialize(*args: Any) -> None:
-            self._listeners.append(self.hass.bus.async_listen(EVENT_CALL_SERVICE, self._async_on_scene_activated))
-
-        if self.hass.is_running:
-            return await async_initialize()
-        else:
-            return self._listeners.append(self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, async_initialize))
+        self._listeners.append(self._manager.add_update_listener(self._on_dynamic_scene_update))
 
     async def async_will_remove_from_hass(self) -> None:
         """ Triggered when the entity is being removed from Home Assistant. """
         while self._listeners:
             self._listeners.pop()()
 
-        for scene in self._scenes.values():
-            scene.stop()
-
 
     #-----------------------------------------------------------------------------#
     #
@@ -158,51 +138,23 @@ class ML_SensorEntity(SensorEntity):
         """ Handles a call to the 'matjak_lighting.dynamic_scene_start' service. """
         scene_id = service_data.get(CONF_ID)
         entity_ids = service_data.get(CONF_LIGHTS, None)
-
-        if scene_id not in self._scenes:
-            return
-
-        self._scenes[scene_id].start(entity_ids=entity_ids if len(entity_ids) > 0 else None)
+        self._manager.start_scene(scene_id, entity_ids=entity_ids if len(entity_ids) > 0 else None)
 
     async def async_service_dynamic_scene_stop(self, **service_data: Any) -> None:
         """ Handles a call to the 'matjak_lighting.dynamic_scene_stop' service. """
         scene_id = service_data.get(CONF_ID)
         entity_ids = service_data.get(CONF_LIGHTS, None)
-
-        if scene_id not in self._scenes:
-            return
-
-        self._scenes.pop(scene_id).stop(entity_ids=entity_ids if len(entity_ids) > 0 else None)
+        self._manager.stop_scene(scene_id, entity_ids=entity_ids if len(entity_ids) > 0 else None)
 
 
     #--------------------------------------------#
     #       Event Handlers
     #--------------------------------------------#
 
-    async def _async_on_scene_activated(self, event: Event) -> None:
-        """ Called when a call_service event has occurred. """
-        domain = event.data.get(ATTR_DOMAIN, None)
-        service = event.data.get(ATTR_SERVICE, None)
-        service_data = event.data.get(ATTR_SERVICE_DATA, {})
-
-        if domain != SCENE_DOMAIN or service != SERVICE_TURN_ON:
+    def _on_dynamic_scene_update(self, scene_id: str) -> None:
+        """ Called when a dynamic scene is updated (stopped or started). Only a changed count is written. """
+        if self.state == self._written_state:
             return
 
-        scene_id = service_data.get(ATTR_ENTITY_ID, None)
-        scene_config = self._config_entry.options.get(scene_id, None)
-        scene_delay = max(service_data.get(ATTR_TRANSITION, MIN_DELAY_TIME), MIN_DELAY_TIME)
-
-        if scene_config is None:
-            return
-
-        if scene_id in self._scenes:
-            self._scenes[scene_id].stop()
-
-        self._scenes[scene_id] = DynamicScene(self.hass, scene_id, scene_config)
-        self._listeners.append(self._scenes[scene_id].add_update_listener(self._on_dynamic_scene_update))
-        self._listeners.append(async_call_later(self.hass, scene_delay, lambda *args: self._scenes[scene_id].start()))
-        self.async_schedule_update_ha_state(True)
-
-    def _on_dynamic_scene_update(self, dynamic_scene: DynamicScene) -> None:
-        """ Called when a dynamic scene is updated (stopped or started) """
-        self.async_schedule_update_ha_state(True)
\ No newline at end of file
+        self._written_state = self.state
+        self.async_write_ha_state()
@@ -0,0 +1,137 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from .const import ATTR_SCENE_ID, DATA_MANAGER, DOMAIN, DOMAIN_FRIENDLY_NAME
+from .utils.scene_manager import DynamicSceneManager
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry
+from logging import getLogger
+from typing import Any, Callable, Dict, List
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+LOGGER = getLogger(__name__)
+
+
+#-----------------------------------------------------------#
+#       Entry Setup
+#-----------------------------------------------------------#
+
+async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: Callable) -> bool:
+    """ Sets up the switch entry. """
+    manager = hass.data[DOMAIN][config_entry.entry_id][DATA_MANAGER]
+
+    def on_scene_ids_changed(added: List[str], removed: List[str]) -> None:
+        async_add_entities([ML_SceneSwitchEntity(manager, scene_id) for scene_id in added])
+
+    manager.add_scene_ids_listener(on_scene_ids_changed)
+    async_add_entities([ML_SceneSwitchEntity(manager, scene_id) for scene_id in manager.scene_ids])
+
+
+#-----------------------------------------------------------#
+#       ML_SceneSwitchEntity
+#-----------------------------------------------------------#
+
+class ML_SceneSwitchEntity(SwitchEntity):
+    """ Entity reflecting (and controlling) whether the dynamic lighting of a single scene is running. """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, manager: DynamicSceneManager, scene_id: str):
+        self._listeners : List[Callable]      = []
+        self._manager   : DynamicSceneManager = manager
+        self._scene_id  : str                 = scene_id
+
+
+    #-----------------------------------------------------------------------------#
+    #
+    #       Entity Section
+    #
+    #-----------------------------------------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """ Gets a dict containing the entity attributes. """
+        return { ATTR_SCENE_ID: self._scene_id }
+
+    @property
+    def icon(self) -> str:
+        """ Gets the icon of the entity. """
+        return "mdi:palette"
+
+    @property
+    def is_on(self) -> bool:
+        """ Gets a boolean indicating whether the dynamic scene is running. """
+        return self._manager.is_running(self._scene_id)
+
+    @property
+    def name(self) -> str:
+        """ Gets the name of the entity. """
+        state = self.hass.states.get(self._scene_id) if self.hass else None
+        return f"{DOMAIN_FRIENDLY_NAME} {state.name if state else self._scene_id}"
+
+    @property
+    def should_poll(self) -> bool:
+        """ Gets a boolean indicating whether Home Assistant should automatically poll the entity. """
+        return False
+
+    @property
+    def unique_id(self) -> str:
+        """ Gets the unique ID of entity. """
+        return f"{DOMAIN}_{self._scene_id}"
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """ Starts the dynamic scene (creating it from the current light states if it is not active). """
+        if self._manager.is_running(self._scene_id):
+            return
+
+        self._manager.activate_scene(self._scene_id)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """ Stops the dynamic scene. """
+        self._manager.stop_scene(self._scene_id)
+
+
+    #--------------------------------------------#
+    #       Event Handlers
+    #--------------------------------------------#
+
+    async def async_added_to_hass(self) -> None:
+        """ Triggered when the entity has been added to Home Assistant. """
+        self._listeners.append(self._manager.add_update_listener(self._on_dynamic_scene_update, scene_id=self._scene_id))
+        self._listeners.append(self._manager.add_scene_ids_listener(self._on_scene_ids_changed))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """ Triggered when the entity is being removed from Home Assistant. """
+        while self._listeners:
+            self._listeners.pop()()
+
+    def _on_dynamic_scene_update(self, scene_id: str) -> None:
+        """ Called when the dynamic scene is started or stopped. """
+        self.async_write_ha_state()
+
+    def _on_scene_ids_changed(self, added: List[str], removed: List[str]) -> None:
+        """ Called when scenes have been added to or removed from the options. Removes the entity if its scene was removed. """
+        if self._scene_id not in removed:
+            return
+
+        registry = entity_registry.async_get(self.hass)
+
+        if registry.async_get(self.entity_id) is not None:
+            return registry.async_remove(self.entity_id)
+
+        self.hass.async_create_task(self.async_remove())
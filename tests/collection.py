@@ -0,0 +1,23 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from pathlib import Path
+import pytest
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+ROOT = Path(__file__).parent.parent
+
+
+#-----------------------------------------------------------#
+#       Hooks
+#-----------------------------------------------------------#
+
+def pytest_collect_directory(path: Path, parent: pytest.Collector) -> pytest.Collector:
+    """ Collects the repository root as a plain directory. It is the integration package, which pytest would otherwise import before every test. """
+    if path == ROOT:
+        return pytest.Dir.from_parent(parent, path=path)
@@ -0,0 +1,112 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from datetime import timedelta
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+import pytest
+import sys
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.components.light import SUPPORT_TRANSITION
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+DOMAIN = "dynamic_scene"
+LIGHTS = ["light.soak_1", "light.soak_2", "light.soak_3"]
+SCENE_ID = "scene.soak"
+SOAK_CYCLES = 500
+
+
+#-----------------------------------------------------------#
+#       Helpers
+#-----------------------------------------------------------#
+
+def _load_integration() -> None:
+    """ Imports the repository root as the integration package. """
+    if DOMAIN in sys.modules:
+        return
+
+    spec = spec_from_file_location(DOMAIN, Path(__file__).parent.parent / "__init__.py", submodule_search_locations=[str(Path(__file__).parent.parent)])
+    module = module_from_spec(spec)
+    sys.modules[DOMAIN] = module
+    spec.loader.exec_module(module)
+
+_load_integration()
+
+const = import_module(f"{DOMAIN}.const")
+DynamicSceneManager = import_module(f"{DOMAIN}.utils.scene_manager").DynamicSceneManager
+DynamicSceneRuntime = import_module(f"{DOMAIN}.utils.runtime").DynamicSceneRuntime
+
+SCENE_CONFIG = {
+    const.CONF_BLOCK_ENTITIES: [],
+    const.CONF_CONTINUOUS_TRANSITION: const.DEFAULT_CONTINUOUS_TRANSITION,
+    const.CONF_DEADBAND_BRIGHTNESS_PCT: const.DEFAULT_DEADBAND_BRIGHTNESS_PCT,
+    const.CONF_DEADBAND_DELTA_E: const.DEFAULT_DEADBAND_DELTA_E,
+    const.CONF_DURATION: 5,
+    const.CONF_MANUAL_CONTROL_HOLD: const.DEFAULT_MANUAL_CONTROL_HOLD,
+    const.CONF_MODE: const.DEFAULT_MODE,
+    const.CONF_ROTATE_COLORS: False,
+    const.CONF_SEED: const.DEFAULT_SEED,
+    const.CONF_START_SPREAD: const.DEFAULT_START_SPREAD,
+    const.CONF_TRANSITION: 2,
+    const.CONF_VARIANCE_BRIGHTNESS_PCT: 5,
+    const.CONF_VARIANCE_COLOR_TEMP: 40,
+    const.CONF_VARIANCE_DURATION: 0,
+    const.CONF_VARIANCE_HUE: 15,
+    const.CONF_VARIANCE_SATURATION: 5,
+    const.CONF_VARIANCE_TRANSITION: 0
+}
+
+
+#-----------------------------------------------------------#
+#       Tests
+#-----------------------------------------------------------#
+
+@pytest.mark.asyncio
+async def test_scene_manager_soak(hass):
+    """ The scheduler entries and the per-scene handles stay bounded while a scene is activated, replaced and stopped repeatedly. """
+    for index, entity_id in enumerate(LIGHTS):
+        hass.states.async_set(entity_id, "on", { "brightness": 200, "color_mode": "hs", "hs_color": [index * 60, 80], "supported_color_modes": ["hs"], "supported_features": SUPPORT_TRANSITION })
+
+    hass.states.async_set(SCENE_ID, "scening", { "entity_id": LIGHTS })
+
+    config_entry = MockConfigEntry(domain=DOMAIN, options={ SCENE_ID: SCENE_CONFIG })
+    config_entry.add_to_hass(hass)
+
+    runtime = DynamicSceneRuntime(hass, config_entry)
+    manager = DynamicSceneManager(hass, config_entry, runtime)
+    now = dt_util.utcnow()
+
+    for cycle in range(SOAK_CYCLES):
+        manager.activate_scene(SCENE_ID, cycle % 3)
+
+        if cycle % 2 == 1:
+            manager.activate_scene(SCENE_ID, 1)
+
+        for _ in range(2):
+            now += timedelta(seconds=3)
+            async_fire_time_changed(hass, now)
+            await hass.async_block_till_done()
+
+        if cycle % 5 == 0:
+            manager.stop_scene(SCENE_ID)
+
+        assert len(manager._scene_listeners) <= 1
+        assert runtime.scheduler.pending <= len(LIGHTS) + 1
+
+    manager.stop_scene(SCENE_ID)
+
+    assert len(manager._scene_listeners) == 0
+    assert runtime.scheduler.pending == 0
+
+    manager.shutdown()
+    runtime.shutdown()
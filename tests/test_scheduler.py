@@ -0,0 +1,131 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+import random
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+SOAK_CYCLES = 1000000
+SOAK_KEYS = 200
+
+
+#-----------------------------------------------------------#
+#       Helpers
+#-----------------------------------------------------------#
+
+def _load_scheduler_module():
+    """ Loads the scheduler module on its own (the utils package imports the whole integration). """
+    spec = spec_from_file_location("dynamic_scene_scheduler", Path(__file__).parent.parent / "utils" / "scheduler.py")
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+scheduler_module = _load_scheduler_module()
+
+
+class FakeTimer:
+    """ A timer handle of the fake loop. """
+    def __init__(self, when, callback):
+        self.callback = callback
+        self.cancelled = False
+        self.when = when
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeLoop:
+    """ The part of the event loop used by the scheduler (time and call_at), driven manually. """
+    def __init__(self):
+        self.now = 0.0
+        self.timer = None
+
+    def call_at(self, when, callback):
+        self.timer = FakeTimer(when, callback)
+        return self.timer
+
+    def fire(self):
+        """ Advances the time to the armed timer and runs it. """
+        timer, self.timer = self.timer, None
+
+        if timer is None or timer.cancelled:
+            return
+
+        self.now = max(self.now, timer.when)
+        timer.callback()
+
+    def time(self):
+        return self.now
+
+
+class FakeHass:
+    """ A Home Assistant instance holding only the fake loop. """
+    def __init__(self):
+        self.loop = FakeLoop()
+
+
+#-----------------------------------------------------------#
+#       Tests
+#-----------------------------------------------------------#
+
+def test_scheduler_soak():
+    """ Heap size and pending actions stay bounded over millions of schedule, cancel and fire cycles. """
+    hass = FakeHass()
+    scheduler = scheduler_module.Scheduler(hass)
+    rng = random.Random(0)
+    fired = [0]
+    max_heap = 0
+
+    def action():
+        fired[0] += 1
+
+    for cycle in range(SOAK_CYCLES):
+        key = rng.randrange(SOAK_KEYS)
+        draw = rng.random()
+
+        if draw < 0.68:
+            scheduler.schedule(key, rng.uniform(0, 3600), action)
+        elif draw < 0.98:
+            scheduler.cancel(key)
+        else:
+            hass.loop.fire()
+
+        max_heap = max(max_heap, len(scheduler._heap))
+        assert scheduler.pending <= SOAK_KEYS
+
+    assert max_heap <= 2 * SOAK_KEYS + scheduler_module.SCHEDULER_COMPACT_THRESHOLD + 1
+    assert fired[0] > 0
+
+    while hass.loop.timer is not None:
+        hass.loop.fire()
+
+    assert scheduler.pending == 0
+    assert len(scheduler._heap) == 0
+
+def test_scheduler_failing_action():
+    """ A failing action does not prevent the other due actions from running or the timer from being re-armed. """
+    hass = FakeHass()
+    scheduler = scheduler_module.Scheduler(hass)
+    fired = []
+
+    def fail():
+        raise RuntimeError("failed")
+
+    scheduler.schedule("a", 1, fail)
+    scheduler.schedule("b", 1, lambda: fired.append("b"))
+    scheduler.schedule("c", 5, lambda: fired.append("c"))
+    hass.loop.fire()
+
+    assert fired == ["b"]
+    assert hass.loop.timer is not None
+
+    hass.loop.fire()
+
+    assert fired == ["b", "c"]
+    assert scheduler.pending == 0
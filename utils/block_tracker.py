@@ -0,0 +1,126 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from homeassistant.const import ATTR_ENTITY_ID, STATE_HOME, STATE_ON, STATE_OPEN, STATE_PLAYING
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+from typing import Callable, Dict, Hashable, Iterable, Set, Union
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+BLOCK_ACTIVE_STATES = [STATE_HOME, STATE_ON, STATE_OPEN, STATE_PLAYING]
+
+
+#-----------------------------------------------------------#
+#       BlockTracker
+#-----------------------------------------------------------#
+
+class BlockTracker:
+    """ Tracks block entities with one state subscription per entity and a counter of active blockers per subscriber. """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant):
+        self._actions       : Dict[Hashable, Callable[[bool], None]] = {}
+        self._active        : Set[str]                               = set()
+        self._counters      : Dict[Hashable, int]                    = {}
+        self._hass          : HomeAssistant                          = hass
+        self._index         : Dict[str, Set[Hashable]]               = {}
+        self._subscriptions : Dict[str, Callable]                    = {}
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def is_blocked(self, key: Hashable) -> bool:
+        """ Gets a boolean indicating whether any of the block entities of a subscriber is active. """
+        return self._counters.get(key, 0) > 0
+
+    def track(self, key: Hashable, entity_ids: Iterable[str], action: Callable[[bool], None]) -> Callable[[], None]:
+        """ Tracks the block entities of a subscriber. The action is called whenever the subscriber becomes blocked or unblocked. """
+        entity_ids = list(set(entity_ids))
+
+        def remove_listener() -> None:
+            for entity_id in entity_ids:
+                subscribers = self._index[entity_id]
+                subscribers.discard(key)
+
+                if len(subscribers) == 0:
+                    self._index.pop(entity_id)
+                    self._subscriptions.pop(entity_id)()
+                    self._active.discard(entity_id)
+
+            self._actions.pop(key, None)
+            self._counters.pop(key, None)
+
+        self._actions[key] = action
+        self._counters[key] = 0
+
+        for entity_id in entity_ids:
+            if entity_id not in self._index:
+                self._index[entity_id] = set()
+                self._subscriptions[entity_id] = async_track_state_change_event(self._hass, [entity_id], self._on_state_changed)
+
+                if _is_active(self._hass.states.get(entity_id)):
+                    self._active.add(entity_id)
+
+            self._index[entity_id].add(key)
+
+            if entity_id in self._active:
+                self._counters[key] += 1
+
+        if self._counters[key] > 0:
+            action(True)
+
+        return remove_listener
+
+    def shutdown(self) -> None:
+        """ Removes all the state subscriptions. """
+        for remove_subscription in self._subscriptions.values():
+            remove_subscription()
+
+        self._actions.clear()
+        self._active.clear()
+        self._counters.clear()
+        self._index.clear()
+        self._subscriptions.clear()
+
+
+    #--------------------------------------------#
+    #       Event Handlers
+    #--------------------------------------------#
+
+    @callback
+    def _on_state_changed(self, event: Event) -> None:
+        """ Called when the state of a block entity has changed. """
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        is_active = _is_active(event.data.get("new_state"))
+
+        if is_active == (entity_id in self._active):
+            return
+
+        if is_active:
+            self._active.add(entity_id)
+        else:
+            self._active.discard(entity_id)
+
+        for key in list(self._index.get(entity_id, [])):
+            counter = self._counters[key] = self._counters[key] + (1 if is_active else -1)
+
+            if counter == (1 if is_active else 0):
+                self._actions[key](is_active)
+
+
+#-----------------------------------------------------------#
+#       Helpers
+#-----------------------------------------------------------#
+
+def _is_active(state: Union[State, None]) -> bool:
+    """ Determines whether a block entity state is active. """
+    return state is not None and state.state in BLOCK_ACTIVE_STATES
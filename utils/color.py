@@ -0,0 +1,195 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from homeassistant.components.light import (
+    ATTR_COLOR_TEMP,
+    ATTR_HS_COLOR,
+    ATTR_RGB_COLOR,
+    ATTR_RGBW_COLOR,
+    ATTR_XY_COLOR,
+    COLOR_MODE_COLOR_TEMP,
+    COLOR_MODE_HS,
+    COLOR_MODE_RGB,
+    COLOR_MODE_RGBW,
+    COLOR_MODE_RGBWW,
+    COLOR_MODE_XY
+)
+from homeassistant.util import color as color_util
+from typing import Any, List, Tuple, Union
+import math
+import numpy as np
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+# sRGB (D65) to CIE XYZ
+RGB_TO_XYZ = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041)
+)
+
+# D65 reference white
+WHITE_POINT = (0.95047, 1.0, 1.08883)
+
+#--- Native color modes (the codes are the indexes of the service data attributes) -----
+NATIVE_NONE = -1
+NATIVE_HS = 0
+NATIVE_XY = 1
+NATIVE_RGB = 2
+NATIVE_RGBW = 3
+NATIVE_COLOR_TEMP = 4
+
+NATIVE_ATTRIBUTES = [ATTR_HS_COLOR, ATTR_XY_COLOR, ATTR_RGB_COLOR, ATTR_RGBW_COLOR, ATTR_COLOR_TEMP]
+
+# The preferred native mode of a light for colors (rgbww lights are sent rgb_color, which Home Assistant converts)
+COLOR_MODE_PREFERENCE = [
+    (COLOR_MODE_HS, NATIVE_HS),
+    (COLOR_MODE_XY, NATIVE_XY),
+    (COLOR_MODE_RGB, NATIVE_RGB),
+    (COLOR_MODE_RGBW, NATIVE_RGBW),
+    (COLOR_MODE_RGBWW, NATIVE_RGB)
+]
+
+KELVIN_RANGE = (1000, 40000)
+
+
+#-----------------------------------------------------------#
+#       Conversions
+#-----------------------------------------------------------#
+
+def color_to_lab(color_mode: str, color_value: Any) -> Tuple[float, float, float]:
+    """ Converts a light color (hs_color or color_temp) at full brightness to CIELAB. """
+    if color_mode == ATTR_COLOR_TEMP:
+        rgb = color_util.color_temperature_to_rgb(color_util.color_temperature_mired_to_kelvin(color_value))
+    else:
+        rgb = color_util.color_hs_to_RGB(*color_value)
+
+    return rgb_to_lab(*rgb)
+
+def rgb_to_lab(red: float, green: float, blue: float) -> Tuple[float, float, float]:
+    """ Converts an sRGB color (0-255) to CIELAB. """
+    linear = [_linearize(value / 255) for value in (red, green, blue)]
+    x, y, z = [sum(factor * value for factor, value in zip(row, linear)) / white for row, white in zip(RGB_TO_XYZ, WHITE_POINT)]
+    fx, fy, fz = _lab_f(x), _lab_f(y), _lab_f(z)
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+#-----------------------------------------------------------#
+#       Native Colors
+#-----------------------------------------------------------#
+
+def format_native_color(code: int, values: np.ndarray) -> Tuple[Union[str, None], Any]:
+    """ Gets the service data attribute and value of a native color (None for lights that only support brightness). """
+    if code == NATIVE_NONE:
+        return None, None
+
+    if code == NATIVE_COLOR_TEMP:
+        return ATTR_COLOR_TEMP, int(round(values[0]))
+
+    if code == NATIVE_HS:
+        return ATTR_HS_COLOR, [round(float(values[0]), 2), round(float(values[1]), 2)]
+
+    if code == NATIVE_XY:
+        return ATTR_XY_COLOR, [round(float(values[0]), 4), round(float(values[1]), 4)]
+
+    return NATIVE_ATTRIBUTES[code], [int(value) for value in np.rint(values[:4 if code == NATIVE_RGBW else 3])]
+
+def get_native_modes(supported_color_modes: List[str]) -> Tuple[int, int]:
+    """ Gets the native modes of a light for color temperatures and for colors. """
+    color_code = next((code for color_mode, code in COLOR_MODE_PREFERENCE if color_mode in supported_color_modes), None)
+    color_temp_code = NATIVE_COLOR_TEMP if COLOR_MODE_COLOR_TEMP in supported_color_modes else None
+
+    if color_code is None and color_temp_code is None:
+        return NATIVE_NONE, NATIVE_NONE
+
+    return (color_temp_code if color_temp_code is not None else color_code), (color_code if color_code is not None else color_temp_code)
+
+def to_native_colors(codes: np.ndarray, is_color_temp: np.ndarray, primary: np.ndarray, secondary: np.ndarray, min_mireds: np.ndarray, max_mireds: np.ndarray) -> np.ndarray:
+    """ Converts whole arrays of palette colors (hs_color or color_temp) to the native color modes of the lights (values padded to 4 components). """
+    rgb = np.where(is_color_temp[..., None], _mireds_to_rgb(primary), _hs_to_rgb(primary, secondary))
+    hue, saturation = _rgb_to_hs(rgb)
+    hs = np.where(is_color_temp[..., None], np.stack([hue, saturation], axis=-1), np.stack([primary, secondary], axis=-1))
+    xy = _rgb_to_xy(rgb)
+    mireds = np.where(is_color_temp, primary, np.clip(_xy_to_mireds(xy), min_mireds, max_mireds))
+    white = rgb.min(axis=-1, keepdims=True)
+
+    candidates = np.stack([
+        _pad(hs),
+        _pad(xy),
+        _pad(rgb),
+        np.concatenate([rgb - white, white], axis=-1),
+        _pad(mireds[..., None])
+    ])
+
+    return np.take_along_axis(candidates, np.maximum(codes, 0)[None, ..., None], axis=0)[0]
+
+
+#-----------------------------------------------------------#
+#       Differences
+#-----------------------------------------------------------#
+
+def delta_e(lab1: Tuple[float, float, float], lab2: Tuple[float, float, float]) -> float:
+    """ Gets the perceptual difference (CIE76 delta E) between two CIELAB colors. """
+    return math.sqrt(sum((value1 - value2) ** 2 for value1, value2 in zip(lab1, lab2)))
+
+
+#-----------------------------------------------------------#
+#       Helpers
+#-----------------------------------------------------------#
+
+def _hs_to_rgb(hue: np.ndarray, saturation: np.ndarray) -> np.ndarray:
+    """ Converts arrays of hue (0-360) and saturation (0-100) at full brightness to sRGB (0-255). """
+    k = (np.array([5, 3, 1]) + np.mod(hue, 360)[..., None] / 60) % 6
+    return 255 * (1 - (saturation[..., None] / 100) * np.clip(np.minimum(k, 4 - k), 0, 1))
+
+def _lab_f(value: float) -> float:
+    """ The non-linear compression used by CIELAB. """
+    return value ** (1 / 3) if value > 0.008856 else 7.787 * value + 16 / 116
+
+def _linearize(value: float) -> float:
+    """ Removes the sRGB gamma companding. """
+    return value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+
+def _mireds_to_rgb(mireds: np.ndarray) -> np.ndarray:
+    """ Converts an array of color temperatures (mireds) to sRGB (0-255), using the same approximation as Home Assistant. """
+    temperature = np.clip(1000000 / np.maximum(mireds, 1), *KELVIN_RANGE) / 100
+
+    red = np.where(temperature <= 66, 255, 329.698727446 * np.maximum(temperature - 60, 1) ** -0.1332047592)
+    green = np.where(temperature <= 66, 99.4708025861 * np.log(temperature) - 161.1195681661, 288.1221695283 * np.maximum(temperature - 60, 1) ** -0.0755148492)
+    blue = np.where(temperature >= 66, 255, np.where(temperature <= 19, 0, 138.5177312231 * np.log(np.maximum(temperature - 10, 1)) - 305.0447927307))
+
+    return np.clip(np.stack([red, green, blue], axis=-1), 0, 255)
+
+def _pad(values: np.ndarray) -> np.ndarray:
+    """ Pads the last axis of an array to 4 components. """
+    return np.concatenate([values, np.zeros(values.shape[:-1] + (4 - values.shape[-1],))], axis=-1)
+
+def _rgb_to_hs(rgb: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """ Converts an array of sRGB colors (0-255) to hue (0-360) and saturation (0-100). """
+    maximum, minimum = rgb.max(axis=-1), rgb.min(axis=-1)
+    delta = np.maximum(maximum - minimum, 1e-9)
+    red, green, blue = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+
+    hue = np.where(maximum == red, (green - blue) / delta, np.where(maximum == green, (blue - red) / delta + 2, (red - green) / delta + 4))
+    saturation = np.where(maximum > 0, (maximum - minimum) / np.maximum(maximum, 1e-9), 0)
+
+    return np.mod(hue * 60, 360), saturation * 100
+
+def _rgb_to_xy(rgb: np.ndarray) -> np.ndarray:
+    """ Converts an array of sRGB colors (0-255) to CIE xy chromaticity. """
+    values = rgb / 255
+    linear = np.where(values <= 0.04045, values / 12.92, ((values + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ np.array(RGB_TO_XYZ).T
+    total = xyz.sum(axis=-1, keepdims=True)
+
+    return np.where(total > 0, xyz[..., :2] / np.maximum(total, 1e-9), np.array([0.3127, 0.3290]))
+
+def _xy_to_mireds(xy: np.ndarray) -> np.ndarray:
+    """ Converts an array of CIE xy chromaticities to the nearest color temperature (mireds), using McCamy's approximation. """
+    n = (xy[..., 0] - 0.3320) / np.minimum(0.1858 - xy[..., 1], -1e-9)
+    kelvin = 449 * n ** 3 + 3525 * n ** 2 + 6823.3 * n + 5520.33
+    return 1000000 / np.clip(kelvin, *KELVIN_RANGE)
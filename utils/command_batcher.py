@@ -0,0 +1,83 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from .command_queue import CommandQueue
+from .scheduler import Scheduler
+from typing import Any, Dict, List, Tuple
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+BATCH_WINDOW = 0.1
+
+
+#-----------------------------------------------------------#
+#       CommandBatcher
+#-----------------------------------------------------------#
+
+class CommandBatcher:
+    """ Integration-wide batch of commands, flushed through the shared scheduler so identical commands of all scenes are merged. """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, command_queue: CommandQueue, scheduler: Scheduler, window: float = BATCH_WINDOW):
+        self._command_queue : CommandQueue                               = command_queue
+        self._pending       : Dict[str, Tuple[str, str, Dict[str, Any]]] = {}
+        self._scheduler     : Scheduler                                  = scheduler
+        self._window        : float                                      = window
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def add(self, domain: str, service: str, entity_id: str, service_data: Dict[str, Any]) -> None:
+        """ Adds a command to the current batch (replacing any pending command for the same entity). """
+        if len(self._pending) == 0:
+            self._scheduler.schedule(self, self._window, self._flush)
+
+        self._pending[entity_id] = (domain, service, service_data)
+
+    def discard(self, entity_ids: List[str] = None) -> None:
+        """ Discards the pending commands of the specified entities (or all entities). """
+        if entity_ids is None:
+            self._pending.clear()
+        else:
+            for entity_id in entity_ids:
+                self._pending.pop(entity_id, None)
+
+        if len(self._pending) == 0:
+            self._scheduler.cancel(self)
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _flush(self) -> None:
+        """ Sends the pending commands, merging entities with identical service data into a single call. """
+        pending, self._pending = self._pending, {}
+        batches: Dict[Tuple, Tuple[str, str, Dict[str, Any], List[str]]] = {}
+
+        for entity_id, (domain, service, service_data) in pending.items():
+            key = (domain, service, tuple(sorted((name, _freeze(value)) for name, value in service_data.items())))
+            batches.setdefault(key, (domain, service, service_data, []))[3].append(entity_id)
+
+        for domain, service, service_data, entity_ids in batches.values():
+            self._command_queue.submit(domain, service, entity_ids, service_data)
+
+
+#-----------------------------------------------------------#
+#       Helpers
+#-----------------------------------------------------------#
+
+def _freeze(value: Any) -> Any:
+    """ Converts a service data value into a hashable value. """
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+
+    return value
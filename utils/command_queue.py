@@ -0,0 +1,125 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from .contextualizer import Contextualizer
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from logging import getLogger
+from typing import Any, Dict, List, Tuple
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+LOGGER = getLogger(__name__)
+MAX_IN_FLIGHT = 1
+
+STAT_COALESCED = "coalesced"
+STAT_DROPPED = "dropped"
+STAT_SENT = "sent"
+
+
+#-----------------------------------------------------------#
+#       CommandQueue
+#-----------------------------------------------------------#
+
+class CommandQueue:
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant, contextualizer: Contextualizer, max_in_flight: int = MAX_IN_FLIGHT):
+        self._contextualizer : Contextualizer                              = contextualizer
+        self._hass           : HomeAssistant                               = hass
+        self._in_flight      : Dict[str, int]                              = {}
+        self._max_in_flight  : int                                         = max_in_flight
+        self._pending        : Dict[str, Tuple[str, str, Dict[str, Any]]]  = {}
+        self._statistics     : Dict[str, int]                              = { STAT_COALESCED: 0, STAT_DROPPED: 0, STAT_SENT: 0 }
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """ Gets the number of commands that have been sent, coalesced (replaced by a newer command) and dropped. """
+        return dict(self._statistics)
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def submit(self, domain: str, service: str, entity_ids: List[str], service_data: Dict[str, Any]) -> None:
+        """ Submits a command. Entities with too many commands in flight keep only the newest command pending. """
+        ready = []
+
+        for entity_id in entity_ids:
+            if self._in_flight.get(entity_id, 0) < self._max_in_flight:
+                ready.append(entity_id)
+                continue
+
+            if entity_id in self._pending:
+                self._statistics[STAT_COALESCED] += 1
+                LOGGER.debug(f"Coalesced pending command for {entity_id}.")
+
+            self._pending[entity_id] = (domain, service, service_data)
+
+        if len(ready) > 0:
+            self._dispatch(domain, service, ready, service_data)
+
+    def discard(self, entity_ids: List[str] = None) -> None:
+        """ Drops the pending commands of the specified entities (or all entities). """
+        if entity_ids is None:
+            entity_ids = list(self._pending.keys())
+
+        for entity_id in entity_ids:
+            if self._pending.pop(entity_id, None) is not None:
+                self._statistics[STAT_DROPPED] += 1
+                LOGGER.debug(f"Dropped pending command for {entity_id}.")
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _dispatch(self, domain: str, service: str, entity_ids: List[str], service_data: Dict[str, Any]) -> None:
+        """ Dispatches a command to the specified entities. """
+        for entity_id in entity_ids:
+            self._in_flight[entity_id] = self._in_flight.get(entity_id, 0) + 1
+
+        self._statistics[STAT_SENT] += 1
+        self._hass.async_create_task(self._async_call_service(domain, service, entity_ids, service_data))
+
+    async def _async_call_service(self, domain: str, service: str, entity_ids: List[str], service_data: Dict[str, Any]) -> None:
+        """ Calls the service and releases the entities once it has completed. """
+        try:
+            await self._contextualizer.async_call_service(domain, service, **{ **service_data, ATTR_ENTITY_ID: entity_ids })
+        except Exception as e:
+            LOGGER.warning(f"Error calling {domain}.{service} for {entity_ids}: {e}")
+        finally:
+            self._release(entity_ids)
+
+    def _release(self, entity_ids: List[str]) -> None:
+        """ Releases the in-flight slots of the specified entities and dispatches their pending commands. """
+        batches: Dict[int, Tuple[str, str, Dict[str, Any], List[str]]] = {}
+
+        for entity_id in entity_ids:
+            in_flight = self._in_flight.get(entity_id, 0) - 1
+
+            if in_flight > 0:
+                self._in_flight[entity_id] = in_flight
+            else:
+                self._in_flight.pop(entity_id, None)
+
+            pending = self._pending.pop(entity_id, None)
+
+            if pending is not None:
+                domain, service, service_data = pending
+                batches.setdefault(id(service_data), (domain, service, service_data, []))[3].append(entity_id)
+
+        for domain, service, service_data, batch_entity_ids in batches.values():
+            self._dispatch(domain, service, batch_entity_ids, service_data)
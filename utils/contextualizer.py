@@ -2,18 +2,25 @@
 #       Imports
 #-----------------------------------------------------------#
 
+from collections import OrderedDict
 from homeassistant.core import Context, HomeAssistant
 from homeassistant.helpers.template import is_template_string, Template
 from homeassistant.util import get_random_string
-from typing import Any, Dict
+from itertools import count
+from logging import getLogger
+from typing import Any, Dict, Union
 
 
 #-----------------------------------------------------------#
 #       Constants
 #-----------------------------------------------------------#
 
+LOGGER = getLogger(__name__)
+
 CONTEXT_PREFIX_LENGTH = 6
 CONTEXT_MAX_LENGTH = 36
+CONTEXT_REGISTRY_SIZE = 1024
+TEMPLATE_CACHE_SIZE = 128
 
 
 #-----------------------------------------------------------#
@@ -25,9 +32,13 @@ class Contextualizer:
     #       Constructor
     #--------------------------------------------#
 
-    def __init__(self, hass: HomeAssistant):
-        self._context_unique_id = get_random_string(6)
+    def __init__(self, hass: HomeAssistant, registry_size: int = 0):
+        self._context_counter = count()
+        self._context_unique_id = get_random_string(CONTEXT_PREFIX_LENGTH)
+        self._contexts: OrderedDict[str, None] = OrderedDict()
         self._hass = hass
+        self._registry_size = registry_size
+        self._templates: OrderedDict[str, Union[Template, None]] = OrderedDict()
 
 
     #--------------------------------------------#
@@ -35,12 +46,27 @@ class Contextualizer:
     #--------------------------------------------#
 
     def create_context(self) -> Context:
-        """ Creates a new context. """
-        return Context(id=f"{self._context_unique_id}{get_random_string(CONTEXT_MAX_LENGTH)}"[:CONTEXT_MAX_LENGTH])
+        """ Creates a new context (the id is the prefix of the instance followed by a counter). """
+        context_id = f"{self._context_unique_id}{next(self._context_counter):0{CONTEXT_MAX_LENGTH - CONTEXT_PREFIX_LENGTH}x}"
+
+        if self._registry_size > 0:
+            self._contexts[context_id] = None
+
+            if len(self._contexts) > self._registry_size:
+                self._contexts.popitem(last=False)
+
+        return Context(id=context_id)
 
     def is_context_internal(self, context: Context) -> bool:
-        """ Determines whether the context is of internal origin (created by the class instance). """
-        return context.id.startswith(self._context_unique_id)
+        """ Determines whether the context is of internal origin (created by the class instance). Matched exactly against the registry of issued ids if it is enabled. """
+        if self._registry_size == 0:
+            return context.id.startswith(self._context_unique_id)
+
+        if context.id not in self._contexts:
+            return False
+
+        self._contexts.move_to_end(context.id)
+        return True
 
 
     #--------------------------------------------#
@@ -54,6 +80,13 @@ class Contextualizer:
         self._hass.async_create_task(self._hass.services.async_call(domain, service, parsed_service_data, context=context))
         return context
 
+    async def async_call_service(self, domain: str, service: str, **service_data: Any) -> Context:
+        """ Calls a service and waits for it to complete. """
+        context = self.create_context()
+        parsed_service_data = self._parse_service_data(service_data)
+        await self._hass.services.async_call(domain, service, parsed_service_data, blocking=True, context=context)
+        return context
+
     def fire_event(self, event_type: str, **event_data: Any) -> Context:
         """ Fires an event using the Home Assistant event bus. """
         context = self.create_context()
@@ -65,19 +98,38 @@ class Contextualizer:
     #       Private Methods
     #--------------------------------------------#
 
+    def _get_template(self, value: str) -> Union[Template, None]:
+        """ Gets the compiled template of a string (None if the string is not a template) from a bounded LRU cache. """
+        if value in self._templates:
+            self._templates.move_to_end(value)
+            return self._templates[value]
+
+        template = Template(value, self._hass) if is_template_string(value) else None
+        self._templates[value] = template
+
+        if len(self._templates) > TEMPLATE_CACHE_SIZE:
+            self._templates.popitem(last=False)
+
+        return template
+
     def _parse_service_data(self, service_data: Dict[str, Any]) -> Dict[str, Any]:
-        """ Parses the service data by rendering possible templates. """
+        """ Parses the service data by rendering possible templates. Service data without any strings is returned as is. """
+        if not any(isinstance(value, str) for value in service_data.values()):
+            return service_data
+
         result = {}
 
         for key, value in service_data.items():
-            if isinstance(value, str) and is_template_string(value):
-                try:
-                    template = Template(value, self.hass)
-                    result[key] = template.async_render()
-                except Exception as e:
-                    self._logger.warn(f"Error parsing {key} in service_data {service_data}: Invalid template was given -> {value}.")
-                    self._logger.warn(e)
-            else:
+            template = self._get_template(value) if isinstance(value, str) else None
+
+            if template is None:
                 result[key] = value
+                continue
+
+            try:
+                result[key] = template.async_render()
+            except Exception as e:
+                LOGGER.warning(f"Error parsing {key} in service_data {service_data}: Invalid template was given -> {value}.")
+                LOGGER.warning(e)
 
         return result
\ No newline at end of file
@@ -3,33 +3,65 @@
 #-----------------------------------------------------------#
 
 from __future__ import annotations
-from . import track_manual_control
-from .contextualizer import Contextualizer
+from .color import color_to_lab, delta_e
+from .runtime import DynamicSceneRuntime
+from .scene_snapshot import SceneSnapshot
+from .scheduler import Scheduler
+from .variance import VarianceStream
 from ..const import (
     ATTR_BLOCK_ENTITIES,
     ATTR_BRIGHTNESS,
     ATTR_COLOR_MODE,
     ATTR_COLOR_TEMP,
-    ATTR_COLOR_VALUE,
     ATTR_ENTITY_ID,
+    ATTR_SUPPORTED_FEATURES,
     ATTR_TRANSITION,
-    CONF_DURATION,
+    CONF_CONTINUOUS_TRANSITION,
+    CONF_DEADBAND_BRIGHTNESS_PCT,
+    CONF_DEADBAND_DELTA_E,
+    CONF_MANUAL_CONTROL_HOLD,
+    CONF_MODE,
     CONF_ROTATE_COLORS,
-    CONF_VARIANCE_BRIGHTNESS_PCT,
-    CONF_VARIANCE_COLOR_TEMP,
-    CONF_VARIANCE_DURATION,
-    CONF_VARIANCE_HUE,
-    CONF_VARIANCE_SATURATION,
-    CONF_VARIANCE_TRANSITION,
+    CONF_START_SPREAD,
+    DEFAULT_CONTINUOUS_TRANSITION,
+    DEFAULT_DEADBAND_BRIGHTNESS_PCT,
+    DEFAULT_DEADBAND_DELTA_E,
+    DEFAULT_MANUAL_CONTROL_HOLD,
+    DEFAULT_MODE,
+    DEFAULT_START_SPREAD,
     LIGHT_DOMAIN,
-    SERVICE_TURN_ON
+    MODE_CONTINUOUS,
+    MODE_SYNCHRONIZED,
+    MODE_TIME_SLOTS,
+    SERVICE_TURN_ON,
+    SUPPORT_TRANSITION
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_call_later
-from typing import Any, Callable, Dict, List
+from functools import partial
+from homeassistant.const import STATE_OFF, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
+from typing import Any, Callable, Dict, List, Tuple, Union
 import random
 
 
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+INACTIVE_STATES = [STATE_OFF, STATE_UNAVAILABLE, STATE_UNKNOWN]
+
+SUSPEND_BLOCKED = "blocked"
+SUSPEND_LIGHT_INACTIVE = "light_inactive"
+SUSPEND_MANUAL_CONTROL = "manual_control"
+SUSPEND_PREEMPTED = "preempted"
+
+STORED_PALETTE_BAGS = "bags"
+STORED_RUNNING = "running"
+STORED_SEED = "seed"
+STORED_SNAPSHOT = "snapshot"
+
+
 #-----------------------------------------------------------#
 #       DynamicScenePart
 #-----------------------------------------------------------#
@@ -39,15 +71,31 @@ class DynamicScenePart:
     #       Constructor
     #--------------------------------------------#
 
-    def __init__(self, hass: HomeAssistant, contextualizer: Contextualizer, entity_id: str, scene_config: Dict[str, Any], light_config: List[Dict[str, Any]]):
-        self._contextualizer = contextualizer
-        self._blocked_indexes = []
+    def __init__(self, hass: HomeAssistant, runtime: DynamicSceneRuntime, entity_id: str, member_ids: List[str], scene_config: Dict[str, Any], snapshot: SceneSnapshot, stream: VarianceStream, on_running_changed: Callable[[bool], None]):
+        self._batcher = runtime.command_batcher
+        self._command_queue = runtime.command_queue
         self._entity_id = entity_id
         self._hass = hass
-        self._light_config = light_config
-        self._listeners = []
+        self._is_activating = False
         self._is_running = False
+        self._last_brightness = None
+        self._last_color_mode = None
+        self._last_lab = None
+        self._inactive_ids = set()
+        self._light_capabilities = runtime.light_capabilities
+        self._light_ownership = runtime.light_ownership
+        self._on_running_changed = on_running_changed
+        self._owned_ids = [entity_id] + member_ids
+        self._palette = snapshot.palette
+        self._preempted_ids = set()
+        self._rate_limiter = runtime.rate_limiter
         self._scene_config = scene_config
+        self._scheduler = runtime.scheduler
+        self._stream = stream
+        self._stream_index = stream.add_part(entity_id)
+        self._supports_transition = False
+        self._suspensions = set()
+        self._timed_suspensions = set()
 
 
     #--------------------------------------------#
@@ -59,89 +107,210 @@ class DynamicScenePart:
         """ Gets a boolean indicating whether the dynamic scene part is currently running. """
         return self._is_running
 
+    @property
+    def is_suspended(self) -> bool:
+        """ Gets a boolean indicating whether the dynamic scene part is suspended (not sending any commands). """
+        return len(self._suspensions) > 0
+
+    @property
+    def palette_bag(self) -> List[int]:
+        """ Gets the palette indexes that have not been drawn yet in the current round. """
+        return self._stream.get_palette_bag(self._stream_index)
+
 
     #--------------------------------------------#
     #       Methods
     #--------------------------------------------#
 
-    def start(self) -> None:
-        """ Starts the dynamic scene part. """
+    def start(self, delay: float = 0) -> None:
+        """ Starts the dynamic scene part (optionally delaying the first update). """
         if self._is_running:
             return
 
+        self._is_activating = True
         self._is_running = True
+        self._on_running_changed(True)
+
+        for entity_id in self._owned_ids:
+            self._light_ownership.claim(entity_id, self, partial(self._on_preempted, entity_id))
+
+        if self.is_suspended:
+            return
+
+        if delay > 0:
+            return self._scheduler.schedule(self, delay, self._update)
+
         self._update()
 
     def stop(self) -> None:
-        """ Stops the dynamic scene part. """
+        """ Stops the dynamic scene part (time-limited suspensions are lifted without updating the light). """
+        for reason in self._timed_suspensions:
+            self._scheduler.cancel((self, reason))
+            self._suspensions.discard(reason)
+
+        self._timed_suspensions.clear()
+
         if not self._is_running:
             return
 
-        while self._listeners:
-            self._listeners.pop()()
-
+        self._scheduler.cancel(self)
+        self._discard_pending()
         self._is_running = False
+        self._on_running_changed(False)
+
+        for entity_id in self._owned_ids:
+            self._light_ownership.release(entity_id, self)
+
+        self._preempted_ids.clear()
+        self._suspensions.discard(SUSPEND_PREEMPTED)
+
+    def suspend(self, reason: str, duration: Union[float, None] = None) -> None:
+        """ Suspends the dynamic scene part for a reason (optionally resuming it automatically after a duration). """
+        self._suspensions.add(reason)
+        self._scheduler.cancel(self)
+        self._discard_pending()
+
+        if duration is not None:
+            self._timed_suspensions.add(reason)
+            self._scheduler.schedule((self, reason), duration, partial(self.resume, reason))
+        elif reason in self._timed_suspensions:
+            self._timed_suspensions.remove(reason)
+            self._scheduler.cancel((self, reason))
+
+    def resume(self, reason: str) -> None:
+        """ Lifts a suspension. The light is updated right away once no suspensions remain. """
+        if reason not in self._suspensions:
+            return
+
+        self._suspensions.remove(reason)
+
+        if reason in self._timed_suspensions:
+            self._timed_suspensions.remove(reason)
+            self._scheduler.cancel((self, reason))
+
+        if self._is_running and not self.is_suspended:
+            self._is_activating = True
+            self._update()
+
+    def restore_palette_bag(self, palette_bag: List[int]) -> None:
+        """ Restores the palette indexes that had not been drawn yet (e.g. before a restart). """
+        self._stream.restore_palette_bag(self._stream_index, palette_bag)
+
+    def update_config(self, scene_config: Dict[str, Any], snapshot: SceneSnapshot) -> None:
+        """ Applies a changed scene configuration, which is picked up on the next update. """
+        self._palette = snapshot.palette
+        self._scene_config = scene_config
+
+    def update_state(self, entity_id: str, state: Union[State, None]) -> None:
+        """ Updates the state of the light (or a member of the light group). The part stays suspended while any of them is off or unavailable, the capabilities are refreshed from the light itself. """
+        if state is None or state.state in INACTIVE_STATES:
+            self._inactive_ids.add(entity_id)
+            return self.suspend(SUSPEND_LIGHT_INACTIVE)
+
+        self._inactive_ids.discard(entity_id)
+
+        if entity_id == self._entity_id:
+            self._supports_transition = bool(state.attributes.get(ATTR_SUPPORTED_FEATURES, 0) & SUPPORT_TRANSITION)
+            self._light_capabilities.refresh(state)
+            self._stream.update_capabilities(self._stream_index)
+
+        if len(self._inactive_ids) == 0:
+            self.resume(SUSPEND_LIGHT_INACTIVE)
 
 
     #--------------------------------------------#
     #       Private Methods
     #--------------------------------------------#
 
-    def _get_attribute(self, value: float, variance: float, min_value: float, max_value: float, modulo: float = None) -> float:
-        """ Gets a newly calculated attribute value. """
-        new_value = random.uniform(value - variance, value + variance)
+    def _discard_pending(self) -> None:
+        """ Discards any command of the light that has not been sent yet. """
+        self._batcher.discard(entity_ids=[self._entity_id])
+        self._command_queue.discard(entity_ids=[self._entity_id])
 
-        if modulo:
-            new_value = new_value % modulo
+    def _is_within_deadband(self, color_mode: str, color_value: Any, brightness: int) -> bool:
+        """ Determines whether a command is perceptually indistinguishable from the last command sent. """
+        if self._last_lab is None or color_mode != self._last_color_mode:
+            return False
 
-        new_value = min(max_value, max(min_value, new_value))
-        return round(new_value, None)
+        brightness_threshold = 255 * self._scene_config.get(CONF_DEADBAND_BRIGHTNESS_PCT, DEFAULT_DEADBAND_BRIGHTNESS_PCT) / 100
 
-    def _update(self, *args: Any) -> None:
-        """ Updates the color of the light. """
-        current_index = random.randint(0, len(self._light_config) - 1)
+        if abs(brightness - self._last_brightness) >= brightness_threshold:
+            return False
 
-        if len(self._light_config) == 1:
-            while current_index in self._blocked_indexes:
-                current_index = random.randint(0, len(self._light_config) - 1)
+        delta_e_threshold = self._scene_config.get(CONF_DEADBAND_DELTA_E, DEFAULT_DEADBAND_DELTA_E)
+        return delta_e(color_to_lab(color_mode, color_value), self._last_lab) < delta_e_threshold
 
-            self._blocked_indexes.append(current_index)
+    def _next_row(self) -> Tuple[List[int], Tuple[Union[str, None], Any], float]:
+        """ Gets the next row of the light, its native color and the number of seconds until the update after it. """
+        mode = self._scene_config.get(CONF_MODE, DEFAULT_MODE)
 
-            if len(self._blocked_indexes) == len(self._light_config):
-                self._blocked_indexes = []
+        if mode != MODE_TIME_SLOTS:
+            row, native_color = self._stream.next(self._stream_index)
 
-        current_light_config = self._light_config[current_index]
+            if mode == MODE_CONTINUOUS and self._supports_transition:
+                transition = self._scene_config.get(CONF_CONTINUOUS_TRANSITION, DEFAULT_CONTINUOUS_TRANSITION)
+                return row[:-2] + [transition, 0], native_color, transition
 
-        color_mode = current_light_config.get(ATTR_COLOR_MODE)
-        color_value = current_light_config.get(ATTR_COLOR_VALUE)
+            return row, native_color, row[-2] + row[-1]
 
-        if color_mode == ATTR_COLOR_TEMP:
-            color_temp_variance = self._scene_config.get(CONF_VARIANCE_COLOR_TEMP)
-            color_value = self._get_attribute(color_value, color_temp_variance, 153, 500)
-        else:
-            hue, saturation = color_value
+        now = dt_util.utcnow().timestamp()
+        slot_length = self._stream.slot_length
+        slot = int(now // slot_length)
+
+        return (*self._stream.get_slot_row(self._stream_index, slot), (slot + 1) * slot_length - now)
+
+    def _send(self, service_data: Dict[str, Any], color_mode: str, color_value: Any, cycle_time: float) -> None:
+        """ Sends a command to the light and schedules the next update. """
+        self._batcher.add(LIGHT_DOMAIN, SERVICE_TURN_ON, self._entity_id, service_data)
+
+        self._last_brightness = service_data[ATTR_BRIGHTNESS]
+        self._last_color_mode = color_mode
+        self._last_lab = color_to_lab(color_mode, color_value)
+
+        self._scheduler.schedule(self, cycle_time, self._update)
 
-            hue_variance = self._scene_config.get(CONF_VARIANCE_HUE)
-            saturation_variance = self._scene_config.get(CONF_VARIANCE_SATURATION)
+    def _update(self, *args: Any) -> None:
+        """ Updates the color of the light. """
+        if not self._is_running or self.is_suspended:
+            return
 
-            hue = self._get_attribute(hue, hue_variance, 0, 360, 360)
-            saturation = self._get_attribute(saturation, saturation_variance, 0, 100)
+        (palette_index, primary, secondary, brightness, transition, duration), (native_attribute, native_value), cycle_time = self._next_row()
+        color_mode = self._palette[palette_index].get(ATTR_COLOR_MODE)
+        color_value = primary if color_mode == ATTR_COLOR_TEMP else [primary, secondary]
 
-            color_value = [hue, saturation]
+        if not self._is_activating and self._is_within_deadband(color_mode, color_value, brightness):
+            return self._scheduler.schedule(self, cycle_time, self._update)
 
-        brightness_pct_variance = self._scene_config.get(CONF_VARIANCE_BRIGHTNESS_PCT)
-        brightness = self._get_attribute(current_light_config.get(ATTR_BRIGHTNESS), 255 * brightness_pct_variance / 100, 0, 255)
+        delay = self._rate_limiter.reserve(self._entity_id, priority=self._is_activating)
+        service_data = { ATTR_BRIGHTNESS: brightness, ATTR_TRANSITION: transition }
+        self._is_activating = False
 
-        transition_variance = self._scene_config.get(CONF_VARIANCE_TRANSITION)
-        transition = self._get_attribute(self._scene_config.get(ATTR_TRANSITION), transition_variance, 2, 100)
+        if native_attribute is not None:
+            service_data[native_attribute] = native_value
 
-        duration_variance = self._scene_config.get(CONF_VARIANCE_DURATION)
-        duration = self._get_attribute(self._scene_config.get(CONF_DURATION), duration_variance, 2, 100)
+        if delay > 0:
+            if self._scene_config.get(CONF_MODE, DEFAULT_MODE) == MODE_TIME_SLOTS:
+                cycle_time -= delay
 
-        service_data = { ATTR_ENTITY_ID: self._entity_id, ATTR_BRIGHTNESS: brightness, color_mode: color_value, ATTR_TRANSITION: transition }
-        self._contextualizer.call_service(LIGHT_DOMAIN, SERVICE_TURN_ON, **service_data)
+            return self._scheduler.schedule(self, delay, partial(self._send, service_data, color_mode, color_value, cycle_time))
 
-        self._listeners.append(async_call_later(self._hass, duration + transition, self._update))
+        self._send(service_data, color_mode, color_value, cycle_time)
+
+
+    #--------------------------------------------#
+    #       Event Handlers
+    #--------------------------------------------#
+
+    def _on_preempted(self, entity_id: str, is_preempted: bool) -> None:
+        """ Called when the light (or a member of the light group) has been claimed by a part of a newer scene, or handed back to this part. The part stays suspended until all of them are handed back. """
+        if is_preempted:
+            self._preempted_ids.add(entity_id)
+            self.suspend(SUSPEND_PREEMPTED)
+        else:
+            self._preempted_ids.discard(entity_id)
+
+            if len(self._preempted_ids) == 0:
+                self.resume(SUSPEND_PREEMPTED)
 
 
 #-----------------------------------------------------------#
@@ -153,21 +322,55 @@ class DynamicScene:
     #       Constructor
     #--------------------------------------------#
 
-    def __init__(self, hass: HomeAssistant, scene_id: str, scene_config: Dict[str, Any]):
-        self._contextualizer : Contextualizer              = Contextualizer(hass)
-        self._hass           : HomeAssistant               = hass
-        self._listeners      : List[Callable]              = []
-        self._scene_parts    : Dict[str, DynamicScenePart] = self._setup_scene_parts(hass, scene_id, scene_config)
+    def __init__(self, hass: HomeAssistant, runtime: DynamicSceneRuntime, scene_id: str, scene_config: Dict[str, Any], snapshot: Union[SceneSnapshot, None] = None, seed: Union[int, None] = None):
+        self._hass               : HomeAssistant               = hass
+        self._light_parts        : Dict[str, DynamicScenePart] = {}
+        self._listeners          : List[Callable]              = []
+        self._running_count      : int                         = 0
+        self._runtime            : DynamicSceneRuntime         = runtime
+        self._scene_config       : Dict[str, Any]              = scene_config
+        self._scene_id           : str                         = scene_id
+        self._scheduler          : Scheduler                   = runtime.scheduler
+        self._seed               : int                         = seed if seed is not None else random.getrandbits(32)
+        self._snapshot           : SceneSnapshot               = snapshot or runtime.snapshot_cache.get(scene_id, scene_config.get(CONF_ROTATE_COLORS, False))
+        self._stream             : VarianceStream              = VarianceStream(scene_id, scene_config, self._snapshot, runtime.light_capabilities, self._seed)
+        self._scene_parts        : Dict[str, DynamicScenePart] = self._setup_scene_parts(self._snapshot, scene_config)
+        self._tracking_listeners : List[Callable]              = []
 
 
     #--------------------------------------------#
     #       Properties
     #--------------------------------------------#
 
+    @property
+    def entity_ids(self) -> List[str]:
+        """ Gets the ids of the lights (and light groups) of the scene. """
+        return list(self._light_parts.keys())
+
+    @property
+    def is_blocked(self) -> bool:
+        """ Gets a boolean indicating whether the dynamic scene is blocked by any of its block entities. """
+        return self._runtime.block_tracker.is_blocked(self)
+
     @property
     def is_running(self) -> bool:
         """ Gets a boolean indicating whether the dynamic scene is currently running. """
-        return len([part for part in self._scene_parts.values() if part.is_running]) > 0
+        return self._running_count > 0
+
+    @property
+    def running_entity_ids(self) -> List[str]:
+        """ Gets the ids of the lights that are currently running. """
+        return [entity_id for entity_id, part in self._scene_parts.items() if part.is_running]
+
+    @property
+    def scene_id(self) -> str:
+        """ Gets the entity id of the scene. """
+        return self._scene_id
+
+    @property
+    def snapshot(self) -> SceneSnapshot:
+        """ Gets the compiled snapshot the scene was set up from. """
+        return self._snapshot
 
 
     #--------------------------------------------#
@@ -183,6 +386,31 @@ class DynamicScene:
         return remove_listener
 
 
+    #--------------------------------------------#
+    #       Methods -> Storage
+    #--------------------------------------------#
+
+    def as_dict(self) -> Dict[str, Any]:
+        """ Gets the running lights, the snapshot and the palette progress of the scene in a compact, JSON serializable form. """
+        return {
+            STORED_PALETTE_BAGS: { entity_id: part.palette_bag for entity_id, part in self._scene_parts.items() if len(part.palette_bag) > 0 },
+            STORED_RUNNING: self.running_entity_ids,
+            STORED_SEED: self._seed,
+            STORED_SNAPSHOT: self._snapshot.as_dict()
+        }
+
+    @staticmethod
+    def from_dict(hass: HomeAssistant, runtime: DynamicSceneRuntime, scene_id: str, scene_config: Dict[str, Any], data: Dict[str, Any]) -> DynamicScene:
+        """ Creates a dynamic scene from its compact form (without reading any light states). """
+        scene = DynamicScene(hass, runtime, scene_id, scene_config, SceneSnapshot.from_dict(data[STORED_SNAPSHOT]).with_rotate_colors(scene_config.get(CONF_ROTATE_COLORS, False)), data.get(STORED_SEED, None))
+
+        for entity_id, palette_bag in data.get(STORED_PALETTE_BAGS, {}).items():
+            if entity_id in scene._scene_parts:
+                scene._scene_parts[entity_id].restore_palette_bag(palette_bag)
+
+        return scene
+
+
     #--------------------------------------------#
     #       Methods -> Controls
     #--------------------------------------------#
@@ -191,11 +419,16 @@ class DynamicScene:
         """ Starts the dynamic scene. """
         is_running = self.is_running
 
-        if entity_ids is None:
-            entity_ids = self._scene_parts.keys()
+        parts = self._get_parts(entity_ids)
+        spread = self._scene_config.get(CONF_START_SPREAD, DEFAULT_START_SPREAD)
+
+        self._start_tracking()
+
+        for index, part in enumerate(parts):
+            part.start(delay=spread * index / len(parts))
 
-        for entity_id in entity_ids:
-            self._scene_parts[entity_id].start()
+        if not self.is_running:
+            self._stop_tracking()
 
         if is_running != self.is_running:
             self._fire_event()
@@ -204,15 +437,34 @@ class DynamicScene:
         """ Stops the dynamic scene. """
         is_running = self.is_running
 
-        if entity_ids is None:
-            entity_ids = self._scene_parts.keys()
+        for part in self._get_parts(entity_ids):
+            part.stop()
 
-        for entity_id in entity_ids:
-            self._scene_parts[entity_id].stop()
+        if not self.is_running:
+            self._stop_tracking()
 
         if is_running != self.is_running:
             self._fire_event()
 
+    def update_config(self, scene_config: Dict[str, Any]) -> None:
+        """ Applies a changed scene configuration without restarting the scene. """
+        previous_config, self._scene_config = self._scene_config, scene_config
+        self._snapshot = self._snapshot.with_rotate_colors(scene_config.get(CONF_ROTATE_COLORS, False))
+        self._stream.update_config(scene_config, self._snapshot)
+
+        for part in self._scene_parts.values():
+            part.update_config(scene_config, self._snapshot)
+
+        if len(self._tracking_listeners) == 0:
+            return
+
+        if any(previous_config.get(key) != scene_config.get(key) for key in [ATTR_BLOCK_ENTITIES, CONF_MANUAL_CONTROL_HOLD]):
+            self._stop_tracking()
+            self._start_tracking()
+
+            if not self.is_blocked:
+                self._on_blocked_changed(False)
+
 
     #--------------------------------------------#
     #       Private Methods
@@ -223,40 +475,83 @@ class DynamicScene:
         for listener in self._listeners:
             listener(self)
 
-    def _setup_scene_parts(self, hass: HomeAssistant, scene_id: str, scene_config: Dict[str, Any]) -> Dict[str, DynamicScenePart]:
-        """ Sets up the individual scene parts. """
-        lights = hass.states.get(scene_id).attributes.get(ATTR_ENTITY_ID, [])
-        lights_config = {}
+    def _get_parts(self, entity_ids: Union[List[str], None]) -> List[DynamicScenePart]:
+        """ Gets the parts controlling the specified lights, or all parts (the members of a light group map to the part of the group). """
+        if entity_ids is None:
+            return list(self._scene_parts.values())
+
+        parts = [self._light_parts[entity_id] for entity_id in entity_ids if entity_id in self._light_parts]
+        return list(dict.fromkeys(parts))
+
+    def _setup_scene_parts(self, snapshot: SceneSnapshot, scene_config: Dict[str, Any]) -> Dict[str, DynamicScenePart]:
+        """ Sets up the individual scene parts from the compiled snapshot of the scene. In synchronized mode, one part drives each light group that covers lights sharing the same color configuration. """
+        groups = {}
 
-        for entity_id in lights:
-            state = hass.states.get(entity_id)
+        if scene_config.get(CONF_MODE, DEFAULT_MODE) == MODE_SYNCHRONIZED and not snapshot.rotate_colors:
+            groups = snapshot.groups
 
-            if state is None:
-                continue
+        grouped = { member for members in groups.values() for member in members }
+        part_ids = list(groups.keys()) + [entity_id for entity_id in snapshot.entity_ids if entity_id not in grouped]
+        scene_parts = { entity_id: DynamicScenePart(self._hass, self._runtime, entity_id, groups.get(entity_id, []), scene_config, snapshot, self._stream, self._on_part_running_changed) for entity_id in part_ids }
 
-            color_mode = state.attributes.get(ATTR_COLOR_MODE, None)
+        for entity_id, part in scene_parts.items():
+            self._light_parts[entity_id] = part
 
-            if color_mode is None:
-                continue
+            for member in groups.get(entity_id, []):
+                self._light_parts[member] = part
 
-            if color_mode != ATTR_COLOR_TEMP:
-                color_mode = f"{color_mode}_color"
+        return scene_parts
 
-            brightness = state.attributes.get(ATTR_BRIGHTNESS)
-            color_value = state.attributes.get(color_mode)
+    def _start_tracking(self) -> None:
+        """ Starts tracking the state and manual control of the lights, including the members of light groups (once for the whole scene). """
+        if len(self._tracking_listeners) > 0:
+            return
+
+        for entity_id, part in self._light_parts.items():
+            part.update_state(entity_id, self._hass.states.get(entity_id))
+
+        self._tracking_listeners.append(async_track_state_change_event(self._hass, list(self._light_parts.keys()), self._on_light_state_changed))
 
-            lights_config.update({ entity_id: [{ ATTR_BRIGHTNESS: brightness, ATTR_COLOR_MODE: color_mode, ATTR_COLOR_VALUE: color_value }] })
+        if len(self._scene_config.get(ATTR_BLOCK_ENTITIES, [])) > 0:
+            self._tracking_listeners.append(self._runtime.block_tracker.track(self, self._scene_config.get(ATTR_BLOCK_ENTITIES), self._on_blocked_changed))
 
-        if scene_config.get(CONF_ROTATE_COLORS):
-            def transform_configs(configs: Dict[str, Any], entity_id: str) -> object:
-                result = [next((config for config_id, config in configs.items() if config_id == entity_id))]
+        if self._scene_config.get(CONF_MANUAL_CONTROL_HOLD, DEFAULT_MANUAL_CONTROL_HOLD) > 0:
+            self._tracking_listeners.append(self._runtime.dispatcher.track_manual_control(self._light_parts.keys(), self._on_manual_control))
 
-                for config in [config for config_id, config in configs.items() if config_id != entity_id]:
-                    result.append({**config, ATTR_BRIGHTNESS: result[0][ATTR_BRIGHTNESS]})
+    def _stop_tracking(self) -> None:
+        """ Stops tracking the lights. """
+        while self._tracking_listeners:
+            self._tracking_listeners.pop()()
 
-                return result
 
-            color_configs = { entity_id: light_config[0] for entity_id, light_config in lights_config.items() }
-            lights_config = { entity_id: transform_configs(color_configs, entity_id) for entity_id in lights_config.keys() }
+    #--------------------------------------------#
+    #       Event Handlers
+    #--------------------------------------------#
 
-        return { entity_id: DynamicScenePart(self._hass, self._contextualizer, entity_id, scene_config, lights_config[entity_id]) for entity_id in lights_config.keys() }
+    def _on_blocked_changed(self, is_blocked: bool) -> None:
+        """ Called when the scene has become blocked or unblocked. """
+        for part in self._scene_parts.values():
+            if is_blocked:
+                part.suspend(SUSPEND_BLOCKED)
+            else:
+                part.resume(SUSPEND_BLOCKED)
+
+    def _on_part_running_changed(self, is_running: bool) -> None:
+        """ Called when a part has been started or stopped. """
+        self._running_count += 1 if is_running else -1
+
+    @callback
+    def _on_light_state_changed(self, event: Event) -> None:
+        """ Called when the state of a light (or a member of a light group) of the scene has changed. """
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        part = self._light_parts.get(entity_id, None)
+
+        if part is not None:
+            part.update_state(entity_id, event.data.get("new_state"))
+
+    def _on_manual_control(self, entity_ids: List[str], context: Context) -> None:
+        """ Called when lights of the scene have been controlled manually. """
+        hold = self._scene_config.get(CONF_MANUAL_CONTROL_HOLD, DEFAULT_MANUAL_CONTROL_HOLD)
+
+        for part in self._get_parts(entity_ids):
+            part.suspend(SUSPEND_MANUAL_CONTROL, hold)
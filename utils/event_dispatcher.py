@@ -0,0 +1,158 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from . import ensure_list
+from .contextualizer import Contextualizer
+from .target_resolver import ATTR_AREA_ID, ATTR_DEVICE_ID, TargetResolver
+from homeassistant.components.scene import DOMAIN as SCENE_DOMAIN
+from homeassistant.const import ATTR_DOMAIN, ATTR_ENTITY_ID, ATTR_SERVICE, ATTR_SERVICE_DATA, EVENT_CALL_SERVICE, SERVICE_TURN_ON
+from homeassistant.core import Context, Event, HomeAssistant, callback
+from typing import Callable, Dict, Iterable, List, Set, Union
+
+
+#-----------------------------------------------------------#
+#       ServiceCallDispatcher
+#-----------------------------------------------------------#
+
+class ServiceCallDispatcher:
+    """ Listens to call_service events once for the whole integration and dispatches the relevant ones. """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant, contextualizer: Contextualizer, target_resolver: TargetResolver):
+        self._contextualizer          : Contextualizer                                         = contextualizer
+        self._domains                 : Dict[str, int]                                         = {}
+        self._entity_index            : Dict[str, List[Callable[[List[str], Context], None]]]  = {}
+        self._hass                    : HomeAssistant                                          = hass
+        self._remove_listener         : Union[Callable, None]                                  = None
+        self._scene_activation_action : Union[Callable[[str, Event], None], None]              = None
+        self._scene_ids               : Set[str]                                               = set()
+        self._target_resolver         : TargetResolver                                         = target_resolver
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def set_scene_ids(self, scene_ids: Iterable[str]) -> None:
+        """ Sets the ids of the scenes that are configured for dynamic lighting. """
+        self._scene_ids = set(scene_ids)
+
+    def track_scene_activation(self, action: Callable[[str, Event], None]) -> Callable[[], None]:
+        """ Tracks activations (scene.turn_on) of the configured scenes. """
+        def remove_listener() -> None:
+            self._scene_activation_action = None
+            self._update_subscription()
+
+        self._scene_activation_action = action
+        self._update_subscription()
+        return remove_listener
+
+    def track_manual_control(self, entity_ids: Iterable[str], action: Callable[[List[str], Context], None]) -> Callable[[], None]:
+        """ Tracks service calls of external origin targeting specific entities. """
+        entity_ids = list(set(entity_ids))
+
+        def remove_listener() -> None:
+            for entity_id in entity_ids:
+                actions = self._entity_index[entity_id]
+                actions.remove(action)
+
+                if len(actions) == 0:
+                    self._entity_index.pop(entity_id)
+                    self._remove_domain(entity_id)
+
+            self._update_subscription()
+
+        for entity_id in entity_ids:
+            if entity_id not in self._entity_index:
+                self._entity_index[entity_id] = []
+                self._add_domain(entity_id)
+
+            self._entity_index[entity_id].append(action)
+
+        self._update_subscription()
+        return remove_listener
+
+    def shutdown(self) -> None:
+        """ Removes the event listener. """
+        self._entity_index.clear()
+        self._domains.clear()
+        self._scene_activation_action = None
+        self._update_subscription()
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _add_domain(self, entity_id: str) -> None:
+        """ Increments the reference count of the domain of an entity. """
+        domain = entity_id.split(".")[0]
+        self._domains[domain] = self._domains.get(domain, 0) + 1
+
+    def _remove_domain(self, entity_id: str) -> None:
+        """ Decrements the reference count of the domain of an entity. """
+        domain = entity_id.split(".")[0]
+        self._domains[domain] -= 1
+
+        if self._domains[domain] == 0:
+            self._domains.pop(domain)
+
+    def _update_subscription(self) -> None:
+        """ Subscribes to (or unsubscribes from) the event bus depending on whether anything is tracked. """
+        is_needed = self._scene_activation_action is not None or len(self._entity_index) > 0
+
+        if is_needed and self._remove_listener is None:
+            self._remove_listener = self._hass.bus.async_listen(EVENT_CALL_SERVICE, self._on_service_call, event_filter=self._filter)
+        elif not is_needed and self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+
+
+    #--------------------------------------------#
+    #       Event Handlers
+    #--------------------------------------------#
+
+    @callback
+    def _filter(self, event: Event) -> bool:
+        """ Determines (synchronously) whether a call_service event may be relevant. Plain entity ids are matched against the index, area and device targets are resolved (once) by the handler. """
+        domain = event.data.get(ATTR_DOMAIN, None)
+        service_data = event.data.get(ATTR_SERVICE_DATA) or {}
+
+        if domain == SCENE_DOMAIN and event.data.get(ATTR_SERVICE, None) == SERVICE_TURN_ON and self._scene_activation_action is not None:
+            if any(scene_id in self._scene_ids for scene_id in ensure_list(service_data.get(ATTR_ENTITY_ID, None))):
+                return True
+
+        if domain not in self._domains or self._contextualizer.is_context_internal(event.context):
+            return False
+
+        if service_data.get(ATTR_AREA_ID, None) or service_data.get(ATTR_DEVICE_ID, None):
+            return True
+
+        return any(entity_id in self._entity_index for entity_id in ensure_list(service_data.get(ATTR_ENTITY_ID, None)))
+
+    @callback
+    def _on_service_call(self, event: Event) -> None:
+        """ Dispatches a relevant call_service event. """
+        domain = event.data.get(ATTR_DOMAIN, None)
+        service_data = event.data.get(ATTR_SERVICE_DATA) or {}
+
+        if domain == SCENE_DOMAIN and event.data.get(ATTR_SERVICE, None) == SERVICE_TURN_ON and self._scene_activation_action is not None:
+            for scene_id in ensure_list(service_data.get(ATTR_ENTITY_ID, None)):
+                if scene_id in self._scene_ids:
+                    self._scene_activation_action(scene_id, event)
+
+        if domain not in self._domains or self._contextualizer.is_context_internal(event.context):
+            return
+
+        actions: Dict[Callable, List[str]] = {}
+
+        for entity_id in self._target_resolver.resolve(service_data):
+            for action in self._entity_index.get(entity_id, []):
+                actions.setdefault(action, []).append(entity_id)
+
+        for action, entity_ids in actions.items():
+            action(entity_ids, event.context)
+
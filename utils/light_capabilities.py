@@ -0,0 +1,126 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from homeassistant.components.light import (
+    ATTR_MAX_MIREDS,
+    ATTR_MIN_MIREDS,
+    ATTR_SUPPORTED_COLOR_MODES,
+    COLOR_MODE_COLOR_TEMP,
+    COLOR_MODE_HS,
+    SUPPORT_COLOR,
+    SUPPORT_COLOR_TEMP
+)
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_SUPPORTED_FEATURES
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers import entity_registry
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+from typing import Any, Callable, Dict, List, Union
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+ATTR_OLD_ENTITY_ID = "old_entity_id"
+
+DEFAULT_MIN_MIREDS = 153
+DEFAULT_MAX_MIREDS = 500
+
+
+#-----------------------------------------------------------#
+#       LightCapabilities
+#-----------------------------------------------------------#
+
+class LightCapabilities:
+    """ Caches the color capabilities of lights (supported color modes and min/max mireds), refreshed when the entity registry or the state of a light changes. """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant):
+        self._cache           : Dict[str, Dict[str, Any]] = {}
+        self._hass            : HomeAssistant             = hass
+        self._remove_listener : Union[Callable, None]     = None
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def get(self, entity_id: str) -> Dict[str, Any]:
+        """ Gets the (cached) capabilities of a light. """
+        capabilities = self._cache.get(entity_id, None)
+
+        if capabilities is None:
+            self._subscribe()
+            capabilities = self._cache[entity_id] = self._build(entity_id, self._hass.states.get(entity_id))
+
+        return capabilities
+
+    def refresh(self, state: State) -> None:
+        """ Refreshes the capabilities of a light from its state (the users of the cache compare them with the values they hold). """
+        self._subscribe()
+        self._cache[state.entity_id] = self._build(state.entity_id, state)
+
+    def shutdown(self) -> None:
+        """ Removes the registry listener and clears the cache. """
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+
+        self._cache.clear()
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _build(self, entity_id: str, state: Union[State, None]) -> Dict[str, Any]:
+        """ Builds the capabilities of a light from its state, falling back to the capabilities stored in the entity registry. """
+        entry = entity_registry.async_get(self._hass).async_get(entity_id)
+        attributes = { **((entry.capabilities or {}) if entry is not None else {}), **(state.attributes if state is not None else {}) }
+
+        supported_color_modes = attributes.get(ATTR_SUPPORTED_COLOR_MODES, None)
+
+        if supported_color_modes is None:
+            supported_color_modes = _get_legacy_color_modes(attributes.get(ATTR_SUPPORTED_FEATURES, 0))
+
+        return {
+            ATTR_MAX_MIREDS: attributes.get(ATTR_MAX_MIREDS, None) or DEFAULT_MAX_MIREDS,
+            ATTR_MIN_MIREDS: attributes.get(ATTR_MIN_MIREDS, None) or DEFAULT_MIN_MIREDS,
+            ATTR_SUPPORTED_COLOR_MODES: list(supported_color_modes)
+        }
+
+    def _subscribe(self) -> None:
+        """ Subscribes to the entity registry events (once). """
+        if self._remove_listener is None:
+            self._remove_listener = self._hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, self._on_registry_updated)
+
+
+    #--------------------------------------------#
+    #       Event Handlers
+    #--------------------------------------------#
+
+    @callback
+    def _on_registry_updated(self, event: Event) -> None:
+        """ Called when the entity registry has been updated. """
+        self._cache.pop(event.data.get(ATTR_ENTITY_ID), None)
+        self._cache.pop(event.data.get(ATTR_OLD_ENTITY_ID), None)
+
+
+#-----------------------------------------------------------#
+#       Helpers
+#-----------------------------------------------------------#
+
+def _get_legacy_color_modes(supported_features: int) -> List[str]:
+    """ Gets the color modes of a light that only reports its supported features. """
+    color_modes = []
+
+    if supported_features & SUPPORT_COLOR:
+        color_modes.append(COLOR_MODE_HS)
+
+    if supported_features & SUPPORT_COLOR_TEMP:
+        color_modes.append(COLOR_MODE_COLOR_TEMP)
+
+    return color_modes
\ No newline at end of file
@@ -0,0 +1,51 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from typing import Callable, Dict, Hashable, List, Tuple
+
+
+#-----------------------------------------------------------#
+#       LightOwnership
+#-----------------------------------------------------------#
+
+class LightOwnership:
+    """ Integration-wide index of the owner of each light, so a light has at most one command stream at a time. """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self):
+        self._claims : Dict[str, List[Tuple[Hashable, Callable[[bool], None]]]] = {}
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def claim(self, entity_id: str, owner: Hashable, action: Callable[[bool], None]) -> None:
+        """ Claims a light. The current owner is preempted (its action is called with True) until the light is handed back. """
+        claims = self._claims.setdefault(entity_id, [])
+        previous_owner = claims[-1] if len(claims) > 0 else None
+
+        claims[:] = [claim for claim in claims if claim[0] is not owner]
+        claims.append((owner, action))
+
+        if previous_owner is not None and previous_owner[0] is not owner:
+            previous_owner[1](True)
+
+    def release(self, entity_id: str, owner: Hashable) -> None:
+        """ Releases a light. If the owner held the light, it is handed back to the most recent remaining claimant (its action is called with False). """
+        claims = self._claims.get(entity_id, [])
+        was_owner = len(claims) > 0 and claims[-1][0] is owner
+
+        claims[:] = [claim for claim in claims if claim[0] is not owner]
+
+        if len(claims) == 0:
+            self._claims.pop(entity_id, None)
+        elif was_owner:
+            claims[-1][1](False)
+
+    def shutdown(self) -> None:
+        """ Removes all claims. """
+        self._claims.clear()
\ No newline at end of file
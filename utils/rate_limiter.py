@@ -0,0 +1,109 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry
+from typing import Dict
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+RATE_LIMIT_BURST = 2.0
+RATE_LIMIT_DEFAULT = "default"
+RATE_LIMIT_DEFAULT_RATE = 10.0
+RATE_LIMIT_RESERVE = 0.25
+
+
+#-----------------------------------------------------------#
+#       TokenBucket
+#-----------------------------------------------------------#
+
+class TokenBucket:
+    """ Token bucket implemented as a generic cell rate algorithm (one timestamp instead of a token count). """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, rate: float, burst: float = RATE_LIMIT_BURST, reserve: float = RATE_LIMIT_RESERVE):
+        self._interval          : float = 1 / rate
+        self._ambient_tolerance : float = burst * self._interval * (1 - reserve)
+        self._tat               : float = 0
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def reserve(self, now: float, priority: bool = False) -> float:
+        """ Reserves a slot for one command and returns the number of seconds until the slot is due. """
+        tat = max(self._tat, now)
+
+        if priority:
+            self._tat = tat + self._interval
+            return 0
+
+        delay = max(0, tat - now - self._ambient_tolerance)
+        self._tat = tat + self._interval
+        return delay
+
+
+#-----------------------------------------------------------#
+#       RateLimiter
+#-----------------------------------------------------------#
+
+class RateLimiter:
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant, rate_limits: Dict[str, float] = {}):
+        self._buckets     : Dict[str, TokenBucket] = {}
+        self._hass        : HomeAssistant          = hass
+        self._platforms   : Dict[str, str]         = {}
+        self._rate_limits : Dict[str, float]       = rate_limits
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def reserve(self, entity_id: str, priority: bool = False) -> float:
+        """ Reserves a command slot for an entity and returns the delay (in seconds) before the command may be sent. """
+        return self._get_bucket(entity_id).reserve(self._hass.loop.time(), priority)
+
+    def set_rate_limits(self, rate_limits: Dict[str, float]) -> None:
+        """ Sets the rate limits per platform (the buckets are rebuilt on their next use if the limits have changed). """
+        if rate_limits == self._rate_limits:
+            return
+
+        self._buckets.clear()
+        self._platforms.clear()
+        self._rate_limits = rate_limits
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _get_bucket(self, entity_id: str) -> TokenBucket:
+        """ Gets the token bucket shared by all the entities of the same platform. """
+        platform = self._platforms.get(entity_id, None)
+
+        if platform is None:
+            platform = self._platforms[entity_id] = self._get_platform(entity_id)
+
+        bucket = self._buckets.get(platform, None)
+
+        if bucket is None:
+            rate = self._rate_limits.get(platform, self._rate_limits.get(RATE_LIMIT_DEFAULT, RATE_LIMIT_DEFAULT_RATE))
+            bucket = self._buckets[platform] = TokenBucket(rate)
+
+        return bucket
+
+    def _get_platform(self, entity_id: str) -> str:
+        """ Gets the platform (integration) of an entity. """
+        entry = entity_registry.async_get(self._hass).async_get(entity_id)
+        return entry.platform if entry is not None and entry.platform in self._rate_limits else RATE_LIMIT_DEFAULT
@@ -0,0 +1,130 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from . import is_scene_id
+from .block_tracker import BlockTracker
+from .command_batcher import CommandBatcher
+from .command_queue import CommandQueue
+from .contextualizer import CONTEXT_REGISTRY_SIZE, Contextualizer
+from .event_dispatcher import ServiceCallDispatcher
+from .light_capabilities import LightCapabilities
+from .light_ownership import LightOwnership
+from .rate_limiter import RateLimiter
+from .scene_snapshot import SceneSnapshotCache
+from .scheduler import Scheduler
+from .target_resolver import TargetResolver
+from ..const import CONF_RATE_LIMITS
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+
+#-----------------------------------------------------------#
+#       DynamicSceneRuntime
+#-----------------------------------------------------------#
+
+class DynamicSceneRuntime:
+    """ Holds the components shared by all the dynamic scenes of a config entry. """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry):
+        self._block_tracker      : BlockTracker          = BlockTracker(hass)
+        self._config_entry       : ConfigEntry           = config_entry
+        self._contextualizer     : Contextualizer        = Contextualizer(hass, CONTEXT_REGISTRY_SIZE)
+        self._hass               : HomeAssistant         = hass
+        self._command_queue      : CommandQueue          = CommandQueue(hass, self._contextualizer)
+        self._target_resolver    : TargetResolver        = TargetResolver(hass)
+        self._dispatcher         : ServiceCallDispatcher = ServiceCallDispatcher(hass, self._contextualizer, self._target_resolver)
+        self._light_capabilities : LightCapabilities     = LightCapabilities(hass)
+        self._light_ownership    : LightOwnership        = LightOwnership()
+        self._rate_limiter       : RateLimiter           = RateLimiter(hass, config_entry.options.get(CONF_RATE_LIMITS, {}))
+        self._scheduler          : Scheduler             = Scheduler(hass)
+        self._command_batcher    : CommandBatcher        = CommandBatcher(self._command_queue, self._scheduler)
+        self._snapshot_cache     : SceneSnapshotCache    = SceneSnapshotCache(hass)
+
+        self.update_options()
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def block_tracker(self) -> BlockTracker:
+        """ Gets the tracker of block entities. """
+        return self._block_tracker
+
+    @property
+    def command_batcher(self) -> CommandBatcher:
+        """ Gets the command batcher shared by all dynamic scenes. """
+        return self._command_batcher
+
+    @property
+    def command_queue(self) -> CommandQueue:
+        """ Gets the per-entity command queue. """
+        return self._command_queue
+
+    @property
+    def contextualizer(self) -> Contextualizer:
+        """ Gets the contextualizer used for all commands. """
+        return self._contextualizer
+
+    @property
+    def dispatcher(self) -> ServiceCallDispatcher:
+        """ Gets the integration-wide call_service event dispatcher. """
+        return self._dispatcher
+
+    @property
+    def light_capabilities(self) -> LightCapabilities:
+        """ Gets the cache of the color capabilities of each light. """
+        return self._light_capabilities
+
+    @property
+    def light_ownership(self) -> LightOwnership:
+        """ Gets the integration-wide index of the owner of each light. """
+        return self._light_ownership
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """ Gets the command budget shared by all dynamic scenes. """
+        return self._rate_limiter
+
+    @property
+    def scheduler(self) -> Scheduler:
+        """ Gets the shared scheduler. """
+        return self._scheduler
+
+    @property
+    def snapshot_cache(self) -> SceneSnapshotCache:
+        """ Gets the cache of compiled scene snapshots. """
+        return self._snapshot_cache
+
+    @property
+    def target_resolver(self) -> TargetResolver:
+        """ Gets the cached service call target resolver. """
+        return self._target_resolver
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def shutdown(self) -> None:
+        """ Cancels all scheduled actions and pending commands. """
+        self._block_tracker.shutdown()
+        self._dispatcher.shutdown()
+        self._light_capabilities.shutdown()
+        self._light_ownership.shutdown()
+        self._target_resolver.shutdown()
+        self._scheduler.shutdown()
+        self._command_batcher.discard()
+        self._snapshot_cache.shutdown()
+        self._command_queue.discard()
+
+    def update_options(self) -> None:
+        """ Applies the options of the config entry to the shared components. """
+        options = self._config_entry.options
+        self._dispatcher.set_scene_ids(key for key in options.keys() if is_scene_id(key))
+        self._rate_limiter.set_rate_limits(options.get(CONF_RATE_LIMITS, {}))
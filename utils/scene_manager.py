@@ -0,0 +1,287 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from . import is_scene_id
+from .dynamic_scene import STORED_RUNNING, DynamicScene
+from .runtime import DynamicSceneRuntime
+from ..const import ATTR_SERVICE_DATA, ATTR_TRANSITION, DOMAIN, EVENT_HOMEASSISTANT_START
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from typing import Any, Callable, Dict, List, Set, Union
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+MIN_DELAY_TIME = 2
+RESTORE_INTERVAL = 1
+
+STORAGE_SAVE_DELAY = 10
+STORAGE_VERSION = 1
+
+
+#-----------------------------------------------------------#
+#       DynamicSceneManager
+#-----------------------------------------------------------#
+
+class DynamicSceneManager:
+    """ Owns the dynamic scenes of a config entry and notifies entities when a scene changes. """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, runtime: DynamicSceneRuntime):
+        self._active_scenes       : Set[str]                                            = set()
+        self._config_entry        : ConfigEntry                                         = config_entry
+        self._hass                : HomeAssistant                                       = hass
+        self._listeners           : List[Callable]                                      = []
+        self._options             : Dict[str, Any]                                      = dict(config_entry.options)
+        self._runtime             : DynamicSceneRuntime                                 = runtime
+        self._scenes              : Dict[str, DynamicScene]                             = {}
+        self._scene_ids_listeners : List[Callable[[List[str], List[str]], None]]        = []
+        self._scene_listeners     : Dict[str, List[Callable]]                           = {}
+        self._store               : Store                                               = Store(hass, STORAGE_VERSION, _get_storage_key(config_entry))
+        self._update_listeners    : Dict[Union[str, None], List[Callable[[str], None]]] = {}
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def active_scenes(self) -> Set[str]:
+        """ Gets the ids of the scenes that are currently running. """
+        return self._active_scenes
+
+    @property
+    def scene_ids(self) -> List[str]:
+        """ Gets the ids of the scenes configured for dynamic lighting. """
+        return [key for key in self._config_entry.options.keys() if is_scene_id(key)]
+
+
+    #--------------------------------------------#
+    #       Methods -> Listeners
+    #--------------------------------------------#
+
+    def add_scene_ids_listener(self, listener: Callable[[List[str], List[str]], None]) -> Callable:
+        """ Adds a listener that is called with the added and removed scene ids when the options change. """
+        def remove_listener() -> None:
+            self._scene_ids_listeners.remove(listener)
+
+        self._scene_ids_listeners.append(listener)
+        return remove_listener
+
+    def add_update_listener(self, listener: Callable[[str], None], scene_id: Union[str, None] = None) -> Callable:
+        """ Adds a listener that is called when a specific scene (or any scene) is started or stopped. """
+        def remove_listener() -> None:
+            self._update_listeners[scene_id].remove(listener)
+
+        self._update_listeners.setdefault(scene_id, []).append(listener)
+        return remove_listener
+
+
+    #--------------------------------------------#
+    #       Methods -> Setup
+    #--------------------------------------------#
+
+    async def async_setup(self) -> None:
+        """ Restores the scenes that were running and starts tracking scene activations once Home Assistant has started. """
+        await self._async_restore_scenes()
+
+        async def async_initialize(*args: Any) -> None:
+            if remove_start_listener in self._listeners:
+                self._listeners.remove(remove_start_listener)
+
+            self._listeners.append(self._runtime.dispatcher.track_scene_activation(self._on_scene_activated))
+
+        remove_start_listener = None
+
+        if self._hass.is_running:
+            return await async_initialize()
+        else:
+            remove_start_listener = self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, async_initialize)
+            return self._listeners.append(remove_start_listener)
+
+    def shutdown(self) -> None:
+        """ Stops all the dynamic scenes and removes all listeners. The stored scenes are kept, so they are resumed on the next setup. """
+        while self._listeners:
+            self._listeners.pop()()
+
+        data = self._get_store_data()
+        self._store.async_delay_save(lambda: data, 0)
+
+        for scene_id in list(self._scene_listeners.keys()):
+            while self._scene_listeners[scene_id]:
+                self._scene_listeners[scene_id].pop()()
+
+            self._remove_scene(scene_id)
+
+        self._scene_ids_listeners.clear()
+
+    def update_options(self) -> None:
+        """ Applies changed options: removed scenes are stopped, changed scenes are updated in place and unchanged scenes keep running. """
+        options, previous_options = dict(self._config_entry.options), self._options
+        self._options = options
+        self._runtime.update_options()
+
+        scene_ids = [key for key in options.keys() if is_scene_id(key)]
+        previous_scene_ids = [key for key in previous_options.keys() if is_scene_id(key)]
+
+        added = [scene_id for scene_id in scene_ids if scene_id not in previous_options]
+        removed = [scene_id for scene_id in previous_scene_ids if scene_id not in options]
+
+        for scene_id in removed:
+            self._remove_scene(scene_id)
+            self._runtime.snapshot_cache.invalidate(scene_id)
+
+        for scene_id in scene_ids:
+            if scene_id in self._scenes and options[scene_id] != previous_options.get(scene_id):
+                self._scenes[scene_id].update_config(options[scene_id])
+
+        if len(added) > 0 or len(removed) > 0:
+            for listener in list(self._scene_ids_listeners):
+                listener(added, removed)
+
+
+    #--------------------------------------------#
+    #       Methods -> Controls
+    #--------------------------------------------#
+
+    def activate_scene(self, scene_id: str, delay: float = 0) -> None:
+        """ Creates a dynamic scene after a delay (from the light states the scene has applied by then) and starts it. """
+        if self._config_entry.options.get(scene_id, None) is None:
+            return
+
+        def create_scene(*args: Any) -> None:
+            self._scene_listeners.pop(scene_id, None)
+            scene_config = self._config_entry.options.get(scene_id, None)
+
+            if scene_config is not None:
+                self._add_scene(DynamicScene(self._hass, self._runtime, scene_id, scene_config), 0)
+
+        self._remove_scene(scene_id)
+        self._scene_listeners[scene_id] = [async_call_later(self._hass, delay, create_scene)]
+
+    def is_running(self, scene_id: str) -> bool:
+        """ Gets a boolean indicating whether a dynamic scene is running. """
+        return scene_id in self._active_scenes
+
+    def start_scene(self, scene_id: str, entity_ids: List[str] = None) -> None:
+        """ Starts (all or some of the lights of) a dynamic scene. """
+        if scene_id not in self._scenes:
+            return
+
+        self._scenes[scene_id].start(entity_ids=entity_ids)
+        self._save()
+
+    def stop_scene(self, scene_id: str, entity_ids: List[str] = None) -> None:
+        """ Stops (all or some of the lights of) a dynamic scene. The scene is removed once none of its lights are running. """
+        if scene_id not in self._scenes:
+            return
+
+        self._scenes[scene_id].stop(entity_ids=entity_ids)
+
+        if not self._scenes[scene_id].is_running:
+            self._remove_scene(scene_id)
+
+        self._save()
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _add_scene(self, scene: DynamicScene, delay: float, entity_ids: List[str] = None) -> None:
+        """ Registers a dynamic scene and starts (all or some of) its lights after a delay. """
+        scene_listeners = [scene.add_update_listener(self._on_dynamic_scene_update)]
+
+        def start_scene(*args: Any) -> None:
+            scene_listeners.remove(remove_start)
+            scene.start(entity_ids=entity_ids)
+
+        remove_start = async_call_later(self._hass, delay, start_scene)
+        scene_listeners.append(remove_start)
+
+        self._scenes[scene.scene_id] = scene
+        self._scene_listeners[scene.scene_id] = scene_listeners
+
+    async def _async_restore_scenes(self) -> None:
+        """ Restarts the scenes that were running straight from their stored snapshots, staggered by a fixed interval. """
+        data = await self._store.async_load() or {}
+        index = 0
+
+        for scene_id, scene_data in data.items():
+            scene_config = self._config_entry.options.get(scene_id, None)
+
+            if scene_config is None or scene_id in self._scenes:
+                continue
+
+            scene = DynamicScene.from_dict(self._hass, self._runtime, scene_id, scene_config, scene_data)
+            entity_ids = [entity_id for entity_id in scene_data.get(STORED_RUNNING, []) if entity_id in scene.entity_ids]
+
+            if len(entity_ids) == 0:
+                continue
+
+            self._runtime.snapshot_cache.put(scene_id, scene.snapshot)
+            self._add_scene(scene, index * RESTORE_INTERVAL, entity_ids)
+            index += 1
+
+    def _get_store_data(self) -> Dict[str, Any]:
+        """ Gets the running scenes in the form they are stored in. """
+        return { scene_id: scene.as_dict() for scene_id, scene in self._scenes.items() if scene.is_running }
+
+    def _notify(self, scene_id: str) -> None:
+        """ Notifies the listeners of a scene and the listeners of all scenes. """
+        for listener in self._update_listeners.get(scene_id, []) + self._update_listeners.get(None, []):
+            listener(scene_id)
+
+    def _remove_scene(self, scene_id: str) -> None:
+        """ Stops a dynamic scene and releases all the handles registered for it. """
+        scene = self._scenes.pop(scene_id, None)
+
+        if scene is not None:
+            scene.stop()
+
+        for remove_listener in self._scene_listeners.pop(scene_id, []):
+            remove_listener()
+
+    def _save(self) -> None:
+        """ Schedules the running scenes to be stored (the palette progress at the time of writing is included). """
+        self._store.async_delay_save(self._get_store_data, STORAGE_SAVE_DELAY)
+
+
+    #--------------------------------------------#
+    #       Event Handlers
+    #--------------------------------------------#
+
+    def _on_dynamic_scene_update(self, dynamic_scene: DynamicScene) -> None:
+        """ Called when a dynamic scene is updated (stopped or started). """
+        if dynamic_scene.is_running:
+            self._active_scenes.add(dynamic_scene.scene_id)
+        else:
+            self._active_scenes.discard(dynamic_scene.scene_id)
+
+        self._notify(dynamic_scene.scene_id)
+        self._save()
+
+    def _on_scene_activated(self, scene_id: str, event: Event) -> None:
+        """ Called when a scene configured for dynamic lighting has been activated. """
+        service_data = event.data.get(ATTR_SERVICE_DATA, {})
+        self.activate_scene(scene_id, max(service_data.get(ATTR_TRANSITION, MIN_DELAY_TIME), MIN_DELAY_TIME))
+
+
+#-----------------------------------------------------------#
+#       Storage
+#-----------------------------------------------------------#
+
+async def async_remove_storage(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """ Removes the stored scenes of a config entry. """
+    await Store(hass, STORAGE_VERSION, _get_storage_key(config_entry)).async_remove()
+
+def _get_storage_key(config_entry: ConfigEntry) -> str:
+    """ Gets the storage key of a config entry. """
+    return f"{DOMAIN}.{config_entry.entry_id}"
\ No newline at end of file
@@ -0,0 +1,263 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from ..const import ATTR_BRIGHTNESS, ATTR_COLOR_MODE, ATTR_COLOR_TEMP, ATTR_COLOR_VALUE, ATTR_ENTITY_ID, ATTR_HS_COLOR, LIGHT_DOMAIN
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, HomeAssistant, callback
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+DEFAULT_BRIGHTNESS = 255
+EVENT_SCENE_RELOADED = "scene_reloaded"
+
+STORED_GROUPS = "groups"
+STORED_INDEXES = "indexes"
+STORED_LIGHTS = "lights"
+STORED_MISSING = "missing"
+STORED_PALETTE = "palette"
+STORED_ROTATE_COLORS = "rotate"
+
+
+#-----------------------------------------------------------#
+#       SceneSnapshot
+#-----------------------------------------------------------#
+
+class SceneSnapshot:
+    """ The compiled light configuration of a scene (palette, color modes and rotation lists). """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, lights: Tuple[str, ...], palette: List[Dict[str, Any]], light_indexes: Dict[str, int], rotate_colors: bool, groups: Dict[str, List[str]] = {}, missing_ids: Tuple[str, ...] = ()):
+        self._all_indexes   : Tuple[int, ...]      = tuple(range(len(palette)))
+        self._groups        : Dict[str, List[str]] = groups
+        self._light_indexes : Dict[str, int]       = light_indexes
+        self._lights        : Tuple[str, ...]      = lights
+        self._missing_ids   : Tuple[str, ...]      = missing_ids
+        self._palette       : List[Dict[str, Any]] = palette
+        self._rotate_colors : bool                 = rotate_colors
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def entity_ids(self) -> List[str]:
+        """ Gets the ids of the lights that are part of the dynamic scene. """
+        return list(self._light_indexes.keys())
+
+    @property
+    def groups(self) -> Dict[str, List[str]]:
+        """ Gets the light groups that exactly cover a set of lights sharing the same color configuration (group id -> member ids). """
+        return self._groups
+
+    @property
+    def is_complete(self) -> bool:
+        """ Gets a boolean indicating whether every light of the scene had a known state when compiled (lights that were off or without a color do not count as missing). """
+        return len(self._missing_ids) == 0
+
+    @property
+    def lights(self) -> Tuple[str, ...]:
+        """ Gets the ids of all the entities of the scene (as listed by the scene entity). """
+        return self._lights
+
+    @property
+    def palette(self) -> List[Dict[str, Any]]:
+        """ Gets the color configurations of the scene. """
+        return self._palette
+
+    @property
+    def rotate_colors(self) -> bool:
+        """ Gets a boolean indicating whether the colors are rotated between the lights. """
+        return self._rotate_colors
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def as_dict(self) -> Dict[str, Any]:
+        """ Gets the snapshot in a compact, JSON serializable form. """
+        return {
+            STORED_GROUPS: self._groups,
+            STORED_INDEXES: self._light_indexes,
+            STORED_LIGHTS: list(self._lights),
+            STORED_MISSING: list(self._missing_ids),
+            STORED_PALETTE: [[config[ATTR_COLOR_MODE], config[ATTR_COLOR_VALUE], config[ATTR_BRIGHTNESS]] for config in self._palette],
+            STORED_ROTATE_COLORS: self._rotate_colors
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> SceneSnapshot:
+        """ Creates a snapshot from its compact form. """
+        palette = [{ ATTR_BRIGHTNESS: brightness, ATTR_COLOR_MODE: color_mode, ATTR_COLOR_VALUE: color_value } for color_mode, color_value, brightness in data[STORED_PALETTE]]
+        return SceneSnapshot(tuple(data[STORED_LIGHTS]), palette, dict(data[STORED_INDEXES]), data[STORED_ROTATE_COLORS], dict(data.get(STORED_GROUPS, {})), tuple(data.get(STORED_MISSING, ())))
+
+    def get_brightness(self, entity_id: str) -> int:
+        """ Gets the brightness of a light (or light group), full brightness if the light did not report one. """
+        brightness = self._palette[self._get_light_index(entity_id)][ATTR_BRIGHTNESS]
+        return brightness if brightness is not None else DEFAULT_BRIGHTNESS
+
+    def get_palette_indexes(self, entity_id: str) -> Tuple[int, ...]:
+        """ Gets the indexes of the palette entries a light (or light group) can use. """
+        if self._rotate_colors:
+            return self._all_indexes
+
+        return (self._get_light_index(entity_id),)
+
+    def with_rotate_colors(self, rotate_colors: bool) -> SceneSnapshot:
+        """ Gets a snapshot sharing the same palette with colors rotated (or not rotated) between the lights. """
+        if rotate_colors == self._rotate_colors:
+            return self
+
+        return SceneSnapshot(self._lights, self._palette, self._light_indexes, rotate_colors, self._groups, self._missing_ids)
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _get_light_index(self, entity_id: str) -> int:
+        """ Gets the palette index of a light (a light group uses the palette index of its members). """
+        if entity_id in self._groups:
+            return self._light_indexes[self._groups[entity_id][0]]
+
+        return self._light_indexes[entity_id]
+
+
+#-----------------------------------------------------------#
+#       SceneSnapshotCache
+#-----------------------------------------------------------#
+
+class SceneSnapshotCache:
+    """ Caches the complete compiled snapshots of scenes until their entities, their options or the scene configuration change. """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass            : HomeAssistant             = hass
+        self._remove_listener : Union[Callable, None]     = None
+        self._snapshots       : Dict[str, SceneSnapshot]  = {}
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def get(self, scene_id: str, rotate_colors: bool) -> SceneSnapshot:
+        """ Gets the snapshot of a scene, compiling it from the light states if it is not cached (or outdated). Snapshots missing the state of a light are not cached. """
+        state = self._hass.states.get(scene_id)
+        lights = tuple(state.attributes.get(ATTR_ENTITY_ID, [])) if state is not None else ()
+        snapshot = self._snapshots.get(scene_id, None)
+
+        if snapshot is not None and snapshot.lights == lights:
+            snapshot = self._snapshots[scene_id] = snapshot.with_rotate_colors(rotate_colors)
+            return snapshot
+
+        if self._remove_listener is None:
+            self._remove_listener = self._hass.bus.async_listen(EVENT_SCENE_RELOADED, self._on_scenes_reloaded)
+
+        snapshot = compile_snapshot(self._hass, lights, rotate_colors)
+        self.put(scene_id, snapshot)
+        return snapshot
+
+    def invalidate(self, scene_id: Union[str, None] = None) -> None:
+        """ Removes the snapshot of a scene (or all scenes) from the cache. """
+        if scene_id is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(scene_id, None)
+
+    def put(self, scene_id: str, snapshot: SceneSnapshot) -> None:
+        """ Adds a snapshot (e.g. one restored from storage) to the cache, unless it is missing the state of a light. """
+        if snapshot.is_complete:
+            self._snapshots[scene_id] = snapshot
+        else:
+            self._snapshots.pop(scene_id, None)
+
+    def shutdown(self) -> None:
+        """ Removes the event listener and clears the cache. """
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+
+        self.invalidate()
+
+
+    #--------------------------------------------#
+    #       Event Handlers
+    #--------------------------------------------#
+
+    @callback
+    def _on_scenes_reloaded(self, event: Event) -> None:
+        """ Called when the scene configuration has been reloaded. """
+        self.invalidate()
+
+
+#-----------------------------------------------------------#
+#       Compilation
+#-----------------------------------------------------------#
+
+def compile_snapshot(hass: HomeAssistant, lights: Tuple[str, ...], rotate_colors: bool) -> SceneSnapshot:
+    """ Compiles a snapshot from the current states of the lights of a scene. Colors are stored as hs_color or color_temp (which Home Assistant reports in every color mode), lights without a color are skipped. Lights without a known state are recorded as missing. """
+    palette = []
+    light_indexes = {}
+    missing_ids = []
+
+    for entity_id in lights:
+        state = hass.states.get(entity_id)
+
+        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            if entity_id.startswith(f"{LIGHT_DOMAIN}."):
+                missing_ids.append(entity_id)
+
+            continue
+
+        color_mode = ATTR_COLOR_TEMP if state.attributes.get(ATTR_COLOR_MODE, None) == ATTR_COLOR_TEMP else ATTR_HS_COLOR
+        color_value = state.attributes.get(color_mode, None)
+
+        if color_value is None:
+            continue
+
+        brightness = state.attributes.get(ATTR_BRIGHTNESS)
+
+        light_indexes[entity_id] = len(palette)
+        palette.append({ ATTR_BRIGHTNESS: brightness, ATTR_COLOR_MODE: color_mode, ATTR_COLOR_VALUE: color_value })
+
+    return SceneSnapshot(lights, palette, light_indexes, rotate_colors, find_uniform_groups(hass, palette, light_indexes), tuple(missing_ids))
+
+def find_uniform_groups(hass: HomeAssistant, palette: List[Dict[str, Any]], light_indexes: Dict[str, int]) -> Dict[str, List[str]]:
+    """ Finds light groups (light entities listing their members in the entity_id attribute) whose members are all lights of the scene sharing the same color configuration. Overlapping groups are resolved greedily, largest first. """
+    candidates = []
+
+    for state in hass.states.async_all(LIGHT_DOMAIN):
+        members = state.attributes.get(ATTR_ENTITY_ID, None)
+
+        if not isinstance(members, (list, tuple)) or len(members) < 2 or state.entity_id in light_indexes:
+            continue
+
+        if not all(member in light_indexes for member in members):
+            continue
+
+        configs = [palette[light_indexes[member]] for member in members]
+
+        if all(config == configs[0] for config in configs):
+            candidates.append((state.entity_id, list(members)))
+
+    groups = {}
+    covered = set()
+
+    for group_id, members in sorted(candidates, key=lambda candidate: len(candidate[1]), reverse=True):
+        if covered.isdisjoint(members):
+            groups[group_id] = members
+            covered.update(members)
+
+    return groups
\ No newline at end of file
@@ -0,0 +1,155 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from asyncio import TimerHandle
+from itertools import count
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Union
+import heapq
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+LOGGER = getLogger(__name__)
+
+SCHEDULER_COMPACT_THRESHOLD = 64
+SCHEDULER_TOLERANCE = 0.05
+
+ENTRY_DUE = 0
+ENTRY_SEQUENCE = 1
+ENTRY_KEY = 2
+ENTRY_ACTION = 3
+
+
+#-----------------------------------------------------------#
+#       Scheduler
+#-----------------------------------------------------------#
+
+class Scheduler:
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant, tolerance: float = SCHEDULER_TOLERANCE):
+        self._cancelled : int                       = 0
+        self._entries   : Dict[Hashable, List[Any]] = {}
+        self._hass      : HomeAssistant             = hass
+        self._heap      : List[List[Any]]           = []
+        self._sequence  : count                     = count()
+        self._timer     : Union[TimerHandle, None]  = None
+        self._timer_due : Union[float, None]        = None
+        self._tolerance : float                     = tolerance
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def pending(self) -> int:
+        """ Gets the number of pending actions. """
+        return len(self._entries)
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def schedule(self, key: Hashable, delay: float, action: Callable[[], None]) -> None:
+        """ Schedules an action to run after a delay (replacing any pending action with the same key). """
+        self.cancel(key)
+
+        entry = [self._hass.loop.time() + max(delay, 0), next(self._sequence), key, action]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        self._arm()
+
+    def cancel(self, key: Hashable) -> None:
+        """ Cancels the pending action with the specified key. """
+        entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return
+
+        entry[ENTRY_ACTION] = None
+        self._cancelled += 1
+
+        if self._cancelled > SCHEDULER_COMPACT_THRESHOLD and self._cancelled > len(self._entries):
+            self._compact()
+
+    def shutdown(self) -> None:
+        """ Cancels all pending actions. """
+        self._disarm()
+        self._cancelled = 0
+        self._entries.clear()
+        self._heap.clear()
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _arm(self) -> None:
+        """ Ensures the timer is set to fire at the earliest deadline. """
+        while self._heap and self._heap[0][ENTRY_ACTION] is None:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+
+        if not self._heap:
+            return self._disarm()
+
+        due = self._heap[0][ENTRY_DUE]
+
+        if self._timer is not None and self._timer_due <= due:
+            return
+
+        self._disarm()
+        self._timer = self._hass.loop.call_at(due, self._fire)
+        self._timer_due = due
+
+    def _compact(self) -> None:
+        """ Removes cancelled entries from the heap. """
+        self._heap = [entry for entry in self._heap if entry[ENTRY_ACTION] is not None]
+        self._cancelled = 0
+        heapq.heapify(self._heap)
+
+    def _disarm(self) -> None:
+        """ Cancels the timer. """
+        if self._timer is not None:
+            self._timer.cancel()
+
+        self._timer = None
+        self._timer_due = None
+
+    def _fire(self) -> None:
+        """ Runs all the actions that are due. """
+        self._timer = None
+        self._timer_due = None
+        deadline = self._hass.loop.time() + self._tolerance
+        actions = []
+
+        while self._heap and self._heap[0][ENTRY_DUE] <= deadline:
+            entry = heapq.heappop(self._heap)
+
+            if entry[ENTRY_ACTION] is None:
+                self._cancelled -= 1
+                continue
+
+            self._entries.pop(entry[ENTRY_KEY], None)
+            actions.append(entry[ENTRY_ACTION])
+
+        try:
+            for action in actions:
+                try:
+                    action()
+                except Exception:
+                    LOGGER.exception(f"Error running scheduled action {action}.")
+        finally:
+            self._arm()
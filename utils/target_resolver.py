@@ -0,0 +1,117 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from . import ensure_list
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.area_registry import EVENT_AREA_REGISTRY_UPDATED
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+from homeassistant.helpers.template import area_entities, device_entities
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+ATTR_AREA_ID = "area_id"
+ATTR_DEVICE_ID = "device_id"
+
+REGISTRY_EVENTS = [EVENT_AREA_REGISTRY_UPDATED, EVENT_DEVICE_REGISTRY_UPDATED, EVENT_ENTITY_REGISTRY_UPDATED]
+
+
+#-----------------------------------------------------------#
+#       TargetResolver
+#-----------------------------------------------------------#
+
+class TargetResolver:
+    """ Resolves service call targets, caching the entities of areas and devices until a registry changes. """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant):
+        self._area_cache   : Dict[str, Tuple[str, ...]] = {}
+        self._device_cache : Dict[str, Tuple[str, ...]] = {}
+        self._hass         : HomeAssistant              = hass
+        self._listeners    : List[Callable]             = []
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def resolve(self, target: Union[str, List[str], Dict[str, Any]]) -> List[str]:
+        """ Resolves the target argument of a service call and returns a list of (unique) entity ids. """
+        if not isinstance(target, dict):
+            return list(dict.fromkeys(cv.ensure_list_csv(target)))
+
+        result = {}
+
+        for area_id in ensure_list(target.get(ATTR_AREA_ID, None)):
+            result.update(dict.fromkeys(self._get_area_entities(area_id)))
+
+        for device_id in ensure_list(target.get(ATTR_DEVICE_ID, None)):
+            result.update(dict.fromkeys(self._get_device_entities(device_id)))
+
+        result.update(dict.fromkeys(ensure_list(target.get(ATTR_ENTITY_ID, None))))
+        return list(result)
+
+    def shutdown(self) -> None:
+        """ Removes the registry listeners and clears the cache. """
+        while self._listeners:
+            self._listeners.pop()()
+
+        self._invalidate()
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _get_area_entities(self, area_id: str) -> Tuple[str, ...]:
+        """ Gets the (cached) entities of an area. """
+        entity_ids = self._area_cache.get(area_id, None)
+
+        if entity_ids is None:
+            self._subscribe()
+            entity_ids = self._area_cache[area_id] = tuple(area_entities(self._hass, area_id))
+
+        return entity_ids
+
+    def _get_device_entities(self, device_id: str) -> Tuple[str, ...]:
+        """ Gets the (cached) entities of a device. """
+        entity_ids = self._device_cache.get(device_id, None)
+
+        if entity_ids is None:
+            self._subscribe()
+            entity_ids = self._device_cache[device_id] = tuple(device_entities(self._hass, device_id))
+
+        return entity_ids
+
+    def _invalidate(self, *args: Any) -> None:
+        """ Clears the cache. """
+        self._area_cache.clear()
+        self._device_cache.clear()
+
+    def _subscribe(self) -> None:
+        """ Subscribes to the registry events (once). """
+        if len(self._listeners) > 0:
+            return
+
+        for event_type in REGISTRY_EVENTS:
+            self._listeners.append(self._hass.bus.async_listen(event_type, self._on_registry_updated))
+
+
+    #--------------------------------------------#
+    #       Event Handlers
+    #--------------------------------------------#
+
+    @callback
+    def _on_registry_updated(self, event: Event) -> None:
+        """ Called when the area, device or entity registry has been updated. """
+        self._invalidate()
+
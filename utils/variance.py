@@ -0,0 +1,254 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from .color import format_native_color, get_native_modes, to_native_colors
+from .light_capabilities import LightCapabilities
+from .scene_snapshot import SceneSnapshot
+from ..const import (
+    ATTR_COLOR_MODE,
+    ATTR_COLOR_TEMP,
+    ATTR_COLOR_VALUE,
+    ATTR_TRANSITION,
+    CONF_DURATION,
+    CONF_SEED,
+    CONF_VARIANCE_BRIGHTNESS_PCT,
+    CONF_VARIANCE_COLOR_TEMP,
+    CONF_VARIANCE_DURATION,
+    CONF_VARIANCE_HUE,
+    CONF_VARIANCE_SATURATION,
+    CONF_VARIANCE_TRANSITION,
+    DEFAULT_SEED
+)
+from homeassistant.components.light import ATTR_MAX_MIREDS, ATTR_MIN_MIREDS, ATTR_SUPPORTED_COLOR_MODES
+from typing import Any, Dict, List, Tuple, Union
+import hashlib
+import numpy as np
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+SAMPLE_COUNT = 5
+VARIANCE_BLOCK_CYCLES = 32
+
+HUE_MODULO = 360
+
+#--- Minimums / Maximums of the secondary color, brightness, transition and duration -----
+ATTRIBUTE_MINIMUMS = np.array([0, 0, 2, 2])
+ATTRIBUTE_MAXIMUMS = np.array([100, 255, 100, 100])
+
+
+#-----------------------------------------------------------#
+#       VarianceStream
+#-----------------------------------------------------------#
+
+class VarianceStream:
+    """ Pre-generates the randomized commands of all the parts of a scene in blocks (parts x cycles x attributes). """
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, scene_id: str, scene_config: Dict[str, Any], snapshot: SceneSnapshot, capabilities: LightCapabilities, seed: int, cycles: int = VARIANCE_BLOCK_CYCLES):
+        self._block                 : Union[np.ndarray, None] = None
+        self._brightness            : List[float]             = []
+        self._capabilities          : LightCapabilities       = capabilities
+        self._cursors               : List[int]               = []
+        self._cycles                : int                     = cycles
+        self._entity_ids            : List[str]               = []
+        self._mireds                : List[Tuple[int, int]]   = []
+        self._native_block          : Union[np.ndarray, None] = None
+        self._native_codes          : Union[np.ndarray, None] = None
+        self._native_modes          : List[Tuple[int, int]]   = []
+        self._palette_bags          : List[List[int]]         = []
+        self._palette_indexes       : List[Tuple[int, ...]]   = []
+        self._palette_is_color_temp : np.ndarray              = None
+        self._palette_primary       : np.ndarray              = None
+        self._palette_secondary     : np.ndarray              = None
+        self._rng                   : np.random.Generator     = np.random.default_rng(seed)
+        self._scene_config          : Dict[str, Any]          = scene_config
+        self._scene_id              : str                     = scene_id
+        self._snapshot              : SceneSnapshot           = snapshot
+
+        self._compile_palette()
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def slot_length(self) -> float:
+        """ Gets the length (in seconds) of the time slots used by the time slot mode. """
+        return max(1, self._scene_config.get(ATTR_TRANSITION) + self._scene_config.get(CONF_DURATION))
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def add_part(self, entity_id: str) -> int:
+        """ Adds a light to the stream and returns the index of its rows. """
+        self._block = None
+        self._brightness.append(self._snapshot.get_brightness(entity_id))
+        self._cursors.append(0)
+        self._entity_ids.append(entity_id)
+        self._mireds.append(None)
+        self._native_modes.append(None)
+        self._palette_bags.append([])
+        self._palette_indexes.append(self._snapshot.get_palette_indexes(entity_id))
+        self.update_capabilities(len(self._entity_ids) - 1)
+        return len(self._entity_ids) - 1
+
+    def get_palette_bag(self, index: int) -> List[int]:
+        """ Gets the palette indexes a part has not drawn yet in the current round. """
+        return self._palette_bags[index]
+
+    def get_slot_row(self, index: int, slot: int) -> Tuple[List[int], Tuple[Union[str, None], Any]]:
+        """ Gets the row and native color of a part for a time slot. The row is a pure function of the scene seed, the entity id and the slot. """
+        key = f"{self._scene_id}:{self._scene_config.get(CONF_SEED, DEFAULT_SEED)}:{self._entity_ids[index]}:{slot}"
+        uniforms = np.frombuffer(hashlib.blake2b(key.encode(), digest_size=8 * (SAMPLE_COUNT + 1)).digest(), dtype="<u8") / 2.0 ** 64
+
+        palette_indexes = self._palette_indexes[index]
+        draws = np.array([palette_indexes[int(uniforms[0] * len(palette_indexes))]])
+
+        parts = np.array([index])
+        rows = self._compute_rows(draws, np.array([self._brightness[index]], dtype=float), uniforms[None, 1:] * 2 - 1, parts)
+        codes, values = self._compute_native_colors(rows, parts)
+
+        return rows[0].tolist(), format_native_color(codes[0], values[0])
+
+    def next(self, index: int) -> Tuple[List[int], Tuple[Union[str, None], Any]]:
+        """ Gets the next row of a part (palette index, primary and secondary color value, brightness, transition and duration) and its native color (service data attribute and value). """
+        if self._block is None or self._cursors[index] >= self._cycles:
+            self._generate()
+
+        cursor = self._cursors[index]
+        self._cursors[index] += 1
+        return self._block[index, cursor].tolist(), format_native_color(self._native_codes[index, cursor], self._native_block[index, cursor])
+
+    def restore_palette_bag(self, index: int, palette_bag: List[int]) -> None:
+        """ Restores the palette indexes a part had not drawn yet (e.g. before a restart). """
+        self._palette_bags[index] = [palette_index for palette_index in palette_bag if palette_index in self._palette_indexes[index]]
+        self._block = None
+
+    def update_capabilities(self, index: int) -> None:
+        """ Reads the capabilities of the light of a part. If they have changed, the pre-generated rows are discarded, so the change applies on the next cycle. """
+        capabilities = self._capabilities.get(self._entity_ids[index])
+        mireds = (capabilities[ATTR_MIN_MIREDS], capabilities[ATTR_MAX_MIREDS])
+        native_modes = get_native_modes(capabilities[ATTR_SUPPORTED_COLOR_MODES])
+
+        if mireds == self._mireds[index] and native_modes == self._native_modes[index]:
+            return
+
+        self._block = None
+        self._mireds[index] = mireds
+        self._native_modes[index] = native_modes
+
+    def update_config(self, scene_config: Dict[str, Any], snapshot: SceneSnapshot) -> None:
+        """ Applies a changed scene configuration. The pre-generated rows are discarded, so the change applies on the next cycle. """
+        self._block = None
+        self._scene_config = scene_config
+
+        if snapshot is self._snapshot:
+            return
+
+        self._snapshot = snapshot
+        self._compile_palette()
+
+        for index, entity_id in enumerate(self._entity_ids):
+            palette_indexes = snapshot.get_palette_indexes(entity_id)
+
+            if palette_indexes != self._palette_indexes[index]:
+                self._palette_bags[index] = []
+                self._palette_indexes[index] = palette_indexes
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _compile_palette(self) -> None:
+        """ Converts the palette into arrays (primary and secondary color value, and whether the color is a color temperature). """
+        palette = self._snapshot.palette
+        is_color_temp = [config[ATTR_COLOR_MODE] == ATTR_COLOR_TEMP for config in palette]
+
+        self._palette_is_color_temp = np.array(is_color_temp, dtype=bool)
+        self._palette_primary = np.array([config[ATTR_COLOR_VALUE] if is_ct else config[ATTR_COLOR_VALUE][0] for config, is_ct in zip(palette, is_color_temp)], dtype=float)
+        self._palette_secondary = np.array([0 if is_ct else config[ATTR_COLOR_VALUE][1] for config, is_ct in zip(palette, is_color_temp)], dtype=float)
+
+    def _compute_native_colors(self, rows: np.ndarray, parts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """ Converts the colors of whole arrays of rows to the native color modes of the lights of their parts (parts has the leading shape of rows). """
+        draws = rows[..., 0]
+        shape = parts.shape + (1,) * (draws.ndim - parts.ndim) + (2,)
+        is_color_temp = self._palette_is_color_temp[draws]
+        mireds = np.array(self._mireds, dtype=float)[parts].reshape(shape)
+        native_modes = np.array(self._native_modes, dtype=np.int64)[parts].reshape(shape)
+
+        codes = np.where(is_color_temp, native_modes[..., 0], native_modes[..., 1])
+        values = to_native_colors(codes, is_color_temp, rows[..., 1].astype(float), rows[..., 2].astype(float), mireds[..., 0], mireds[..., 1])
+
+        return codes, values
+
+    def _compute_rows(self, draws: np.ndarray, brightness: np.ndarray, samples: np.ndarray, parts: np.ndarray) -> np.ndarray:
+        """ Computes rows from palette draws, brightness centers and samples in [-1, 1] (applying variance, clamping to the mireds range of each light and modulo to the whole array). """
+        config = self._scene_config
+        mireds = np.array(self._mireds, dtype=float)[parts].reshape(parts.shape + (1,) * (draws.ndim - parts.ndim) + (2,))
+        is_color_temp = self._palette_is_color_temp[draws]
+        shape = draws.shape
+
+        centers = np.stack([
+            self._palette_primary[draws],
+            self._palette_secondary[draws],
+            np.broadcast_to(brightness, shape),
+            np.full(shape, config.get(ATTR_TRANSITION), dtype=float),
+            np.full(shape, config.get(CONF_DURATION), dtype=float)
+        ], axis=-1)
+
+        variances = np.stack([
+            np.where(is_color_temp, config.get(CONF_VARIANCE_COLOR_TEMP), config.get(CONF_VARIANCE_HUE)),
+            np.full(shape, config.get(CONF_VARIANCE_SATURATION), dtype=float),
+            np.full(shape, 255 * config.get(CONF_VARIANCE_BRIGHTNESS_PCT) / 100, dtype=float),
+            np.full(shape, config.get(CONF_VARIANCE_TRANSITION), dtype=float),
+            np.full(shape, config.get(CONF_VARIANCE_DURATION), dtype=float)
+        ], axis=-1)
+
+        values = centers + samples * variances
+        values[..., 0] = np.where(is_color_temp, np.clip(values[..., 0], mireds[..., 0], mireds[..., 1]), np.mod(values[..., 0], HUE_MODULO))
+        values[..., 1:] = np.clip(values[..., 1:], ATTRIBUTE_MINIMUMS, ATTRIBUTE_MAXIMUMS)
+
+        return np.concatenate([draws[..., None], np.rint(values).astype(np.int64)], axis=-1)
+
+    def _draw_palette_index(self, index: int) -> int:
+        """ Draws the next palette index of a part from a shuffled bag, so every color is used once before any is repeated. """
+        palette_indexes = self._palette_indexes[index]
+
+        if len(palette_indexes) == 1:
+            return palette_indexes[0]
+
+        if len(self._palette_bags[index]) == 0:
+            self._palette_bags[index] = list(palette_indexes)
+            self._rng.shuffle(self._palette_bags[index])
+
+        return self._palette_bags[index].pop()
+
+    def _generate(self) -> None:
+        """ Generates the next block of rows for all parts, keeping the rows the parts have not used yet. """
+        parts, cycles = len(self._entity_ids), self._cycles
+        leftovers = [self._block[index, cursor:] if self._block is not None else None for index, cursor in enumerate(self._cursors)]
+        draws = np.zeros((parts, cycles), dtype=np.int64)
+
+        for index, leftover in enumerate(leftovers):
+            for cycle in range(cycles - (len(leftover) if leftover is not None else 0)):
+                draws[index, cycle] = self._draw_palette_index(index)
+
+        block = self._compute_rows(draws, np.array(self._brightness, dtype=float)[:, None], self._rng.uniform(-1, 1, (parts, cycles, SAMPLE_COUNT)), np.arange(parts))
+
+        for index, leftover in enumerate(leftovers):
+            if leftover is not None and len(leftover) > 0:
+                block[index] = np.concatenate([leftover, block[index, :cycles - len(leftover)]])
+
+        self._block = block
+        self._cursors = [0] * parts
+        self._native_codes, self._native_block = self._compute_native_colors(block, np.arange(parts))
\ No newline at end of file